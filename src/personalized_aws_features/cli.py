@@ -8,7 +8,6 @@ import argparse
 import sys
 from typing import List, Optional
 
-from personalized_aws_features.core.processor import process_features
 from personalized_aws_features.core.logger import setup_logging, logger
 
 
@@ -27,7 +26,10 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "--workers",
         type=int,
         default=10,
-        help="Number of parallel workers for processing announcements (default: 10)",
+        help=(
+            "Maximum number of parallel workers for processing announcements, "
+            "reduced automatically when Bedrock throttles (default: 10)"
+        ),
     )
     parser.add_argument(
         "--model",
@@ -44,6 +46,11 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--no-history", action="store_true", help="Disable DynamoDB history tracking"
     )
+    parser.add_argument(
+        "--prefilter",
+        action="store_true",
+        help="Skip the Bedrock call for announcements that mention none of your services by name",
+    )
     parser.add_argument(
         "--ddb-table",
         type=str,
@@ -94,6 +101,9 @@ def main(args: Optional[List[str]] = None) -> int:
     # Initialize logging
     setup_logging(log_level=config["log_level"])
 
+    # Deferred so --help and argument errors don't pay for importing boto3
+    from personalized_aws_features.core.processor import process_features
+
     try:
         # Process features using the core processor
         process_features(config)
@@ -15,8 +15,9 @@ def display_announcement_list(title: str, announcements: List[Dict]) -> None:
     print(f"\n{title}:\n")
 
     for i, announcement in enumerate(announcements, 1):
-        services_str = ", ".join(announcement.get("services", []))
-        print(f"  {i}. {announcement['title']}")
+        title, services = announcement["title"], announcement.get("services")
+        services_str = ", ".join(services) if services else ""
+        print(f"  {i}. {title}")
         if services_str:
             print(f"     [Services detected: {services_str}]\n")
 
@@ -31,23 +32,27 @@ def display_detailed_announcements(announcements: List[Dict]) -> None:
     print("\n=== Relevant AWS Service Updates ===\n")
 
     for i, announcement in enumerate(announcements, 1):
-        logger.debug(f"Displaying announcement {i}: {announcement['title']}")
-        print(f"Update {i}: {announcement['title']}")
+        # Look each field up once; the same values feed both print and logging
+        title = announcement["title"]
+        link = announcement["link"]
+        summary = announcement.get("summary") or "No summary available."
+        services_str = ", ".join(announcement.get("services") or ())
+
+        logger.debug(f"Displaying announcement {i}: {title}")
+        print(f"Update {i}: {title}")
         print(f"Posted: {announcement['datePosted']}")
 
         # Display summary
-        summary = announcement.get("summary", "No summary available.")
         print(f"\nSummary: {summary}")
 
         # Display services directly without formatting
-        services_str = ", ".join(announcement.get("services", []))
         print(f"\nMentioned Services: {services_str}")
         logger.debug(f"Services: {services_str}")
 
-        print(f"\nMore info: {announcement['link']}")
+        print(f"\nMore info: {link}")
         print("-" * 80)
         logger.debug(f"Summary: {summary}")
-        logger.debug(f"Link: {announcement['link']}")
+        logger.debug(f"Link: {link}")
 
 
 def display_service_summary(service_count: int, services_list: List[str]) -> None:
@@ -56,17 +61,14 @@ def display_service_summary(service_count: int, services_list: List[str]) -> Non
 
     if service_count > 0:
         print("\nServices found in your AWS environment:")
-        col_width = max(len(s) for s in services_list) + 2
+        col_width = max(map(len, services_list)) + 2
         cols = 3
         rows = (service_count + cols - 1) // cols
 
+        # Pad once, then take each row as a column-major stride of the grid
+        padded = tuple(s.ljust(col_width) for s in services_list)
         for i in range(rows):
-            row_services = []
-            for j in range(cols):
-                idx = i + j * rows
-                if idx < service_count:
-                    row_services.append(services_list[idx].ljust(col_width))
-            print("  " + "".join(row_services))
+            print("  " + "".join(padded[i::rows]))
 
         logger.debug(f"All services: {', '.join(services_list)}")
 
@@ -10,28 +10,40 @@ import os
 logger = logging.getLogger("personalized_aws_features")
 
 
+# Set once the root handler has been configured
+_configured = False
+
+
 def setup_logging(log_level="INFO") -> logging.Logger:
     """
     Set up basic logging configuration.
 
+    The root handler is configured on the first call only; later calls (e.g.
+    from a warm Lambda container) just update the level.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _configured
+
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
-    # Determine if running in aws (simpler timestamps for CloudWatch)
-    is_aws_env = "AWS_EXECUTION_ENV" in os.environ
+    if not _configured:
+        # Determine if running in aws (simpler timestamps for CloudWatch)
+        is_aws_env = "AWS_EXECUTION_ENV" in os.environ
+
+        # Set format based on environment
+        log_format = (
+            "%(levelname)s - %(name)s - %(message)s"
+            if is_aws_env
+            else "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+        )
 
-    # Set format based on environment
-    log_format = (
-        "%(levelname)s - %(name)s - %(message)s"
-        if is_aws_env
-        else "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-    )
+        # Configure logging
+        logging.basicConfig(level=numeric_level, format=log_format)
+        logging.getLogger("botocore").setLevel(logging.WARNING)
+        _configured = True
 
-    # Configure logging
-    logging.basicConfig(level=numeric_level, format=log_format)
     logger.setLevel(numeric_level)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
 
     return logger
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Local keyword prefilter for AWS announcements.
+
+Rejects announcements that cannot mention any of the user's services before
+they are sent to Bedrock. Matching errs on the side of keeping announcements:
+anything that matches is still classified by the model.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+from personalized_aws_features.core.logger import logger
+
+# EC2 usage is billed under two service names, and EBS volumes, snapshots and
+# NAT gateways fall under "EC2 - Other"
+_EC2_FAMILY = ("ec2", "elastic compute cloud", "ebs", "elastic block store")
+
+# Extra keywords keyed on the service names Cost Explorer reports (and the
+# DEFAULT_SERVICES added to them), lowercase and with the Amazon/AWS prefix and
+# usage suffix removed
+SERVICE_ALIASES = {
+    "elastic compute cloud": _EC2_FAMILY,
+    "ec2": _EC2_FAMILY,
+    "ec2 container registry": ("ecr", "elastic container registry"),
+    "elastic container service": ("ecs", "fargate"),
+    "elastic container service for kubernetes": (
+        "eks",
+        "elastic kubernetes service",
+        "kubernetes",
+    ),
+    "elastic mapreduce": ("emr",),
+    "database migration service": ("dms",),
+    "managed streaming for apache kafka": ("msk", "kafka"),
+    "simple storage service": ("s3",),
+    "relational database service": ("rds", "aurora"),
+    "virtual private cloud": ("vpc",),
+    "simple notification service": ("sns",),
+    "simple queue service": ("sqs",),
+    "simple email service": ("ses",),
+    "key management service": ("kms",),
+    "elastic load balancing": ("elb", "load balancer", "load balancing"),
+    "elastic file system": ("efs",),
+    "kinesis firehose": ("firehose",),
+    "systems manager": ("ssm",),
+    "cloudwatch": ("cloudwatch logs",),
+    "cost explorer": ("cost management", "budgets"),
+    "route 53": ("route53",),
+    "opensearch service": ("opensearch", "elasticsearch"),
+    "bedrock": ("nova",),
+    # Default services that never appear in billing data
+    "identity management": ("iam", "identity and access management"),
+    "single sign-on": ("sso", "iam identity center", "identity center"),
+}
+
+_PREFIX_RE = re.compile(r"^(?:amazon|aws)\s*", re.IGNORECASE)
+
+
+def service_keywords(service_name: str) -> Set[str]:
+    """
+    Derive lowercase match keywords from a Cost Explorer service name.
+
+    Args:
+        service_name: Service name such as "Amazon Elastic Compute Cloud - Compute"
+
+    Returns:
+        Set of keywords, e.g. {"elastic compute cloud", "ec2"}
+    """
+    # Drop the usage suffix ("- Compute", "- Other") and any "(abbreviation)"
+    base, _, _ = service_name.partition(" - ")
+    keywords = {m.lower() for m in re.findall(r"\(([^)]+)\)", base)}
+    base = re.sub(r"\([^)]*\)", " ", base)
+    base = _PREFIX_RE.sub("", base.strip()).strip().lower()
+
+    if base:
+        keywords.add(base)
+        keywords.update(SERVICE_ALIASES.get(base, ()))
+
+    return keywords
+
+
+def build_service_pattern(user_services: Dict) -> Optional[Pattern]:
+    """
+    Compile one case-insensitive pattern matching any of the user's services.
+
+    Args:
+        user_services: Dictionary of user services
+
+    Returns:
+        Compiled pattern, or None if no keywords could be derived
+    """
+    keywords = set()
+    for s in user_services.get("services", []):
+        keywords.update(service_keywords(s["service"]))
+
+    if not keywords:
+        return None
+
+    # Longest first so the alternation prefers the most specific keyword
+    alternation = "|".join(
+        re.escape(k) for k in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+
+def prefilter_announcements(
+    announcements: List[Dict], user_services: Dict
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Split announcements into Bedrock candidates and certain non-matches.
+
+    Args:
+        announcements: List of announcements to check
+        user_services: Dictionary of user services
+
+    Returns:
+        Tuple of (candidate_announcements, rejected_announcements)
+    """
+    pattern = build_service_pattern(user_services)
+    if pattern is None:
+        return announcements, []
+
+    candidates = []
+    rejected = []
+
+    for announcement in announcements:
+        text = f"{announcement['title']} {announcement.get('description', '')}"
+        if pattern.search(text):
+            candidates.append(announcement)
+        else:
+            announcement["services"] = []
+            announcement["relevant"] = False
+            rejected.append(announcement)
+
+    logger.info(
+        "Prefilter rejected %d of %d announcement(s) without a Bedrock call",
+        len(rejected),
+        len(announcements),
+    )
+    return candidates, rejected
@@ -1,23 +1,31 @@
 #!/usr/bin/env python3
 """Core processing logic for the AWS Feature Notifier."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any
 
 from personalized_aws_features.integrations.cost_explorer import get_services
 from personalized_aws_features.integrations.bedrock import (
+    build_prompt_prefix,
     process_announcements_in_parallel,
 )
 from personalized_aws_features.integrations.rss_feed import fetch_aws_whats_new
 from personalized_aws_features.integrations.dynamodb import (
+    generate_announcement_id,
+    generate_prompt_digest,
+    generate_verdict_key,
+    get_cached_verdicts,
     get_dynamodb_table,
+    get_seen_ids,
     save_announcement,
-    is_announcement_seen,
+    save_verdicts,
 )
 from personalized_aws_features.core.display import (
     display_announcement_list,
     display_detailed_announcements,
     display_service_summary,
 )
+from personalized_aws_features.core.prefilter import prefilter_announcements
 from personalized_aws_features.integrations.slack import send_announcements_to_slack
 from personalized_aws_features.core.logger import logger
 
@@ -38,7 +46,7 @@ def setup_dynamodb(table_name: str, region: str, no_history: bool) -> Any:
         logger.info("History tracking disabled, skipping DynamoDB setup")
         return None
 
-    logger.debug(f"Setting up DynamoDB table '{table_name}' in region '{region}'")
+    logger.debug("Setting up DynamoDB table '%s' in region '%s'", table_name, region)
     return get_dynamodb_table(table_name=table_name, region=region)
 
 
@@ -50,25 +58,77 @@ def get_and_analyze_services() -> Tuple[Dict, int, List[str]]:
     service_count = len(user_services["services"])
     services_list = sorted([s["service"] for s in user_services["services"]])
 
-    logger.debug(f"Found {service_count} services")
+    logger.debug("Found %d services", service_count)
     return user_services, service_count, services_list
 
 
-def fetch_and_process_announcements(
-    days_back: int, user_services: Dict, model_id: str, max_workers: int, region: str
+def apply_cached_verdicts(
+    announcements: List[Dict], ddb_table: Any, model_id: str, prompt_digest: str
 ) -> Tuple[List[Dict], List[Dict]]:
-    """Fetch and process AWS announcements."""
-    raw_announcements = fetch_aws_whats_new(days_back=days_back)
+    """Apply verdicts cached by earlier runs, returning (uncached, cached)."""
+    verdicts = get_cached_verdicts(announcements, ddb_table, model_id, prompt_digest)
 
-    if not raw_announcements:
-        return [], []
+    uncached = []
+    cached = []
 
-    logger.info(
-        f"Processing {len(raw_announcements)} announcement(s) with model {model_id}"
-    )
-    return process_announcements_in_parallel(
-        raw_announcements, user_services, model_id, max_workers, region
-    )
+    for announcement in announcements:
+        verdict = verdicts.get(generate_verdict_key(announcement))
+        if verdict is None:
+            uncached.append(announcement)
+        else:
+            announcement.update(verdict)
+            cached.append(announcement)
+
+    return uncached, cached
+
+
+def process_announcements(
+    raw_announcements: List[Dict],
+    user_services: Dict,
+    model_id: str,
+    max_workers: int,
+    region: str,
+    prefilter: bool = False,
+    ddb_table: Any = None,
+) -> Tuple[List[Dict], List[Dict]]:
+    """Process fetched AWS announcements."""
+    rejected = []
+    if prefilter and raw_announcements:
+        raw_announcements, rejected = prefilter_announcements(
+            raw_announcements, user_services
+        )
+
+    # Reuse verdicts from earlier runs instead of asking Bedrock again, as long
+    # as they were made against the same service list
+    cached = []
+    prompt_digest = None
+    if ddb_table is not None and raw_announcements:
+        prompt_digest = generate_prompt_digest(build_prompt_prefix(user_services))
+        raw_announcements, cached = apply_cached_verdicts(
+            raw_announcements, ddb_table, model_id, prompt_digest
+        )
+
+    relevant = [a for a in cached if a.get("relevant", False)]
+    non_relevant = [a for a in cached if not a.get("relevant", False)]
+
+    if raw_announcements:
+        logger.info(
+            "Processing %d announcement(s) with model %s",
+            len(raw_announcements),
+            model_id,
+        )
+        new_relevant, new_non_relevant = process_announcements_in_parallel(
+            raw_announcements, user_services, model_id, max_workers, region
+        )
+        if ddb_table is not None:
+            save_verdicts(
+                new_relevant + new_non_relevant, ddb_table, model_id, prompt_digest
+            )
+
+        relevant += new_relevant
+        non_relevant += new_non_relevant
+
+    return relevant, non_relevant + rejected
 
 
 def filter_seen_announcements(
@@ -79,17 +139,20 @@ def filter_seen_announcements(
         logger.info("History tracking disabled, skipping filtering")
         return announcements, []
 
+    # One batched lookup for all announcements instead of a GetItem per item
+    seen_ids = get_seen_ids(announcements, ddb_table)
+
     new_announcements = []
     filtered_announcements = []
 
     for announcement in announcements:
-        if is_announcement_seen(announcement, ddb_table):
+        if generate_announcement_id(announcement) in seen_ids:
             filtered_announcements.append(announcement)
         else:
             new_announcements.append(announcement)
 
     logger.info(
-        f"Filtered {len(filtered_announcements)} previously seen announcement(s)"
+        "Filtered %d previously seen announcement(s)", len(filtered_announcements)
     )
     return new_announcements, filtered_announcements
 
@@ -102,7 +165,7 @@ def send_slack_notifications(
         logger.warning("Slack integration enabled but missing token or channel")
         return
 
-    logger.debug(f"Preparing to send {len(announcements)} announcements to Slack")
+    logger.debug("Preparing to send %d announcements to Slack", len(announcements))
     slack_results = send_announcements_to_slack(
         announcements, slack_token, slack_channel
     )
@@ -119,27 +182,42 @@ def send_slack_notifications(
 def process_features(config: Dict) -> Dict:
     """Process AWS feature announcements based on usage."""
     logger.info("Starting AWS Feature Notifier")
-    logger.debug(f"Configuration: {config}")
+    logger.debug("Configuration: %s", config)
     region = config["region"]
     results = initialize_results()
-
-    # Setup resources
-    ddb_table = setup_dynamodb(config["ddb_table"], region, config["no_history"])
     use_history = not config["no_history"]
     verbose = config.get("verbose", False)
 
+    # DynamoDB setup, Cost Explorer and the RSS feed are independent network
+    # calls, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        ddb_future = executor.submit(
+            setup_dynamodb, config["ddb_table"], region, config["no_history"]
+        )
+        services_future = executor.submit(get_and_analyze_services)
+        feed_future = executor.submit(fetch_aws_whats_new, days_back=config["days"])
+
+    # Setup resources
+    ddb_table = ddb_future.result()
+
     try:
         # Get and analyze services
-        user_services, service_count, services_list = get_and_analyze_services()
+        user_services, service_count, services_list = services_future.result()
         results["service_count"] = service_count
 
-        logger.info(f"Found {service_count} services in your AWS environment")
+        logger.info("Found %d services in your AWS environment", service_count)
         if verbose:
             display_service_summary(service_count, services_list)
 
         # Process announcements
-        relevant, non_relevant = fetch_and_process_announcements(
-            config["days"], user_services, config["model"], config["workers"], region
+        relevant, non_relevant = process_announcements(
+            feed_future.result(),
+            user_services,
+            config["model"],
+            config["workers"],
+            region,
+            prefilter=config.get("prefilter", False),
+            ddb_table=ddb_table,
         )
 
         # Update results
@@ -147,7 +225,7 @@ def process_features(config: Dict) -> Dict:
         results["relevant_count"] = len(relevant)
 
         # Show non-relevant announcements if verbose
-        logger.info(f"Found {len(non_relevant)} non-relevant announcements")
+        logger.info("Found %d non-relevant announcements", len(non_relevant))
         if verbose and non_relevant:
             display_announcement_list(
                 f"All {len(non_relevant)} non-relevant announcements", non_relevant
@@ -166,7 +244,7 @@ def process_features(config: Dict) -> Dict:
                 )
 
         # Display and save relevant announcements
-        logger.info(f"Found {len(relevant)} relevant announcements for your services")
+        logger.info("Found %d relevant announcements for your services", len(relevant))
         if verbose and relevant:
             display_announcement_list(
                 f"Found {len(relevant)} relevant announcements", relevant
@@ -191,5 +269,5 @@ def process_features(config: Dict) -> Dict:
         return results
 
     except Exception as e:
-        logger.error(f"Error processing features: {e}", exc_info=True)
+        logger.error("Error processing features: %s", e, exc_info=True)
         raise
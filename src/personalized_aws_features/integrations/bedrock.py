@@ -3,50 +3,120 @@
 Bedrock integration for AWS Service News Analyzer
 """
 
-import json
-import re
+import threading
 import boto3
-from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from personalized_aws_features.core.logger import logger
 
 # API call tracking (to be refactored later as exportable metrics)
 _api_calls = {"total": 0, "throttled": 0, "errors": 0}
 
+# Bedrock clients keyed by region, shared across worker threads
+_CLIENT_CACHE: Dict[str, Any] = {}
+_CLIENT_LOCK = threading.Lock()
 
-def process_announcement_with_bedrock(
-    announcement: Dict,
-    user_services: Dict,
-    model_id: Optional[str] = None,
-    region: str = "us-east-1",
-) -> Dict:
-    """Process AWS announcements using Amazon Bedrock.
 
-    Args:
-        announcement: The announcement to process
-        user_services: Dictionary of user services
-        model_id: Bedrock model ID to use
-        region: AWS region for Bedrock client
+class AdaptiveLimiter:
+    """Concurrency limiter for Bedrock calls using AIMD, like TCP congestion control.
 
-    Returns:
-        Processed announcement with relevance and services
+    The number of calls allowed in flight starts at max_concurrency, is halved
+    whenever a call is throttled and grows back by roughly one per window of
+    successful calls. max_concurrency stays an upper bound, not a target.
+
+    A call counts as throttled when it raises ThrottlingException or when the
+    response reports retries: botocore's adaptive retries absorb most throttles
+    before one is ever raised.
     """
-    try:
-        logger.debug(f"Processing announcement with Bedrock: {announcement['title']}")
-        _api_calls["total"] += 1
 
-        # Create Bedrock client with specified region - important to know if chosen model is region-specific
-        bedrock = boto3.client("bedrock-runtime", region_name=region)
+    def __init__(self, max_concurrency: int):
+        self._max = max(1, max_concurrency)
+        self._limit = float(self._max)
+        self._active = 0
+        self._cond = threading.Condition()
 
-        user_service_names = [s["service"] for s in user_services.get("services", [])]
-        service_list = ", ".join([f'"{name}"' for name in user_service_names])
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
 
-        prompt = f"""Analyze this AWS announcement and determine if it's relevant to the user based on the services they use.
+    def call(self, func: Callable[..., Dict], *args: Any, **kwargs: Any) -> Dict:
+        """Run a boto3 call once a slot is free and adjust the limit from its outcome.
 
-        User's AWS Services: {service_list}
+        Args:
+            func: boto3 client method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
 
-        Title: {announcement['title']}
-        Description: {announcement.get('description', '')}
+        Returns:
+            The boto3 response
+        """
+        with self._cond:
+            while self._active >= int(self._limit):
+                self._cond.wait()
+            self._active += 1
+
+        throttled = succeeded = False
+        try:
+            response = func(*args, **kwargs)
+            succeeded = True
+            retries = response.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+            throttled = retries > 0
+            return response
+        except Exception as e:
+            throttled = "ThrottlingException" in str(e)
+            raise
+        finally:
+            self._release(throttled, succeeded)
+
+    def _release(self, throttled: bool, succeeded: bool) -> None:
+        """Free a slot, halving the limit on throttling and growing it on success."""
+        with self._cond:
+            self._active -= 1
+            if throttled:
+                self._limit = max(1.0, self._limit / 2)
+                logger.debug(
+                    "Throttled, reducing Bedrock concurrency to %d", self.limit
+                )
+            elif succeeded and self._limit < self._max:
+                self._limit = min(float(self._max), self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+
+def _get_bedrock_client(region: str, max_pool_connections: int = 10) -> Any:
+    """Return a cached Bedrock runtime client for the region, creating it once.
+
+    Client construction is expensive and not thread-safe on a shared boto3
+    session, so the client gets its own session and is created under a lock.
+    The client itself is safe to share.
+    The connection pool size is fixed when the client is first created.
+
+    Adaptive retries rate-limit the client from observed throttling instead of
+    sleeping through fixed exponential backoff.
+    """
+    with _CLIENT_LOCK:
+        if region not in _CLIENT_CACHE:
+            logger.debug("Creating Bedrock runtime client for region %s", region)
+            _CLIENT_CACHE[region] = boto3.session.Session().client(
+                "bedrock-runtime",
+                region_name=region,
+                config=Config(
+                    retries={"max_attempts": 10, "mode": "adaptive"},
+                    max_pool_connections=max_pool_connections,
+                ),
+            )
+        return _CLIENT_CACHE[region]
+
+
+# Invariant part of the prompt, formatted once per batch with the user's services.
+# The announcement itself is appended after a cache point so Bedrock can reuse
+# the prefix tokens across every announcement in a run.
+PROMPT_TEMPLATE_PREFIX = """Analyze the AWS announcement at the end of this message and determine if it's relevant to the user
+        based on the services they use.
+
+        User's AWS Services: {service_list}
 
         CRITICAL INSTRUCTIONS:
         1. Extract ALL AWS services mentioned BY NAME in the announcement - be thorough (ABSOLUTELY DO NOT JUST DUMP THE User's
@@ -68,68 +138,203 @@ def process_announcement_with_bedrock(
         - Include specific details like region names, percentages, or capabilities
         - Be direct and clear
 
-        Output format - a valid JSON object with:
+        Output format - call the classify_announcement tool with:
         - "relevant": true/false based on service matching
         - "services": [array of ALL AWS service names mentioned in the announcement]
         - "summary": A concise summary if relevant, otherwise empty string
-
-        Format response as valid JSON only with no other text.
         """
 
-        conversation = [{"role": "user", "content": [{"text": prompt}]}]
+# Answering through a tool makes Bedrock return the verdict as parsed JSON
+# matching this schema instead of free text
+CLASSIFY_TOOL_NAME = "classify_announcement"
+CLASSIFY_TOOL_CONFIG = {
+    "tools": [
+        {
+            "toolSpec": {
+                "name": CLASSIFY_TOOL_NAME,
+                "description": "Record the relevance verdict for an AWS announcement",
+                "inputSchema": {
+                    "json": {
+                        "type": "object",
+                        "properties": {
+                            "relevant": {"type": "boolean"},
+                            "services": {"type": "array", "items": {"type": "string"}},
+                            "summary": {"type": "string"},
+                        },
+                        "required": ["relevant", "services"],
+                    }
+                },
+            }
+        }
+    ],
+}
+FORCED_CLASSIFY_TOOL_CONFIG = {
+    **CLASSIFY_TOOL_CONFIG,
+    "toolChoice": {"tool": {"name": CLASSIFY_TOOL_NAME}},
+}
+
+# Models that accept a cachePoint block (Bedrock prompt caching). Bedrock rejects
+# the block for any other model, including older Claude models such as Claude 3
+# Haiku, so this is an exact list of base model IDs rather than a family match.
+PROMPT_CACHING_MODELS = frozenset(
+    {
+        "amazon.nova-micro-v1:0",
+        "amazon.nova-lite-v1:0",
+        "amazon.nova-pro-v1:0",
+        "amazon.nova-premier-v1:0",
+        "anthropic.claude-3-5-haiku-20241022-v1:0",
+        "anthropic.claude-3-7-sonnet-20250219-v1:0",
+        "anthropic.claude-sonnet-4-20250514-v1:0",
+        "anthropic.claude-sonnet-4-5-20250929-v1:0",
+        "anthropic.claude-haiku-4-5-20251001-v1:0",
+        "anthropic.claude-opus-4-20250514-v1:0",
+        "anthropic.claude-opus-4-1-20250805-v1:0",
+    }
+)
+
+# Cross-region inference profile IDs prefix the base model ID with a geography,
+# e.g. "us.amazon.nova-lite-v1:0"
+_INFERENCE_PROFILE_PREFIXES = (
+    "us.",
+    "us-gov.",
+    "eu.",
+    "apac.",
+    "jp.",
+    "au.",
+    "global.",
+)
+
+# Model families that accept a forced toolChoice, matched as substrings. Other
+# models get the tool with the default choice and rely on the prompt to call it.
+FORCED_TOOL_MODEL_FAMILIES = (
+    "anthropic.claude",
+    "amazon.nova",
+    "mistral.mistral-large",
+)
+
+
+def _model_in_families(model_id: Optional[str], families: Tuple[str, ...]) -> bool:
+    """Check whether a Bedrock model ID belongs to one of the model families."""
+    return any(family in (model_id or "") for family in families)
+
+
+def _supports_prompt_caching(model_id: Optional[str]) -> bool:
+    """Check whether a model ID, inference profile ID or ARN supports caching."""
+    base_id = (model_id or "").rsplit("/", 1)[-1]
+    for prefix in _INFERENCE_PROFILE_PREFIXES:
+        if base_id.startswith(prefix):
+            base_id = base_id[len(prefix) :]
+            break
+    return base_id in PROMPT_CACHING_MODELS
+
+
+def build_prompt_prefix(user_services: Dict) -> str:
+    """Build the announcement-independent part of the Bedrock prompt.
 
-        response = bedrock.converse(
-            modelId=model_id,
-            messages=conversation,
-            inferenceConfig={"maxTokens": 500, "temperature": 0.1, "topP": 0.1},
+    Args:
+        user_services: Dictionary of user services
+
+    Returns:
+        Prompt prefix containing the instructions and the user's services
+    """
+    service_list = ", ".join(
+        f'"{s["service"]}"' for s in user_services.get("services", [])
+    )
+    return PROMPT_TEMPLATE_PREFIX.format(service_list=service_list)
+
+
+def process_announcement_with_bedrock(
+    announcement: Dict,
+    prompt_prefix: str,
+    model_id: Optional[str] = None,
+    region: str = "us-east-1",
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Dict:
+    """Process AWS announcements using Amazon Bedrock.
+
+    Args:
+        announcement: The announcement to process
+        prompt_prefix: Shared prompt prefix from build_prompt_prefix
+        model_id: Bedrock model ID to use
+        region: AWS region for Bedrock client
+        limiter: Optional concurrency limiter shared by the worker pool
+
+    Returns:
+        Processed announcement with relevance and services
+    """
+    try:
+        logger.debug("Processing announcement with Bedrock: %s", announcement["title"])
+        _api_calls["total"] += 1
+
+        # Bedrock client for the specified region - important to know if chosen model is region-specific
+        bedrock = _get_bedrock_client(region)
+
+        announcement_text = (
+            f"Title: {announcement['title']}\n"
+            f"Description: {announcement.get('description', '')}"
         )
 
-        response_text = response["output"]["message"]["content"][0]["text"]
+        # Cache point after the shared prefix enables Bedrock prompt caching
+        message_content = [{"text": prompt_prefix}]
+        if _supports_prompt_caching(model_id):
+            message_content.append({"cachePoint": {"type": "default"}})
+        message_content.append({"text": announcement_text})
+        conversation = [{"role": "user", "content": message_content}]
+
+        tool_config = (
+            FORCED_CLASSIFY_TOOL_CONFIG
+            if _model_in_families(model_id, FORCED_TOOL_MODEL_FAMILIES)
+            else CLASSIFY_TOOL_CONFIG
+        )
 
-        # Log full response for debugging
-        logger.debug(f"Title: {announcement['title']}")
-        logger.debug(f"Bedrock response: {response_text}")
+        request = {
+            "modelId": model_id,
+            "messages": conversation,
+            "inferenceConfig": {"maxTokens": 500, "temperature": 0.1, "topP": 0.1},
+            "toolConfig": tool_config,
+        }
+        if limiter is not None:
+            response = limiter.call(bedrock.converse, **request)
+        else:
+            response = bedrock.converse(**request)
 
-        # Parse JSON response
-        try:
-            # First try direct JSON parsing
-            try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError:
-                # If that fails, try regex extraction
-                json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group(0))
-                else:
-                    raise ValueError("Could not extract JSON from response")
-
-            announcement["services"] = result.get("services", [])
-            announcement["relevant"] = result.get("relevant", False)
-
-            if result.get("relevant", False):
-                announcement["summary"] = result.get("summary", "")
-                logger.debug(f"Relevant announcement found: {announcement['title']}")
-            else:
-                logger.debug(f"Irrelevant announcement: {announcement['title']}")
+        content = response["output"]["message"]["content"]
+        result = next(
+            (block["toolUse"]["input"] for block in content if "toolUse" in block),
+            None,
+        )
 
-            return announcement
+        # Log full response for debugging
+        logger.debug("Title: %s", announcement["title"])
+        logger.debug("Bedrock response: %s", content)
 
-        except (json.JSONDecodeError, ValueError) as e:
+        if result is None:
             _api_calls["errors"] += 1
-            logger.error(
-                f"Error parsing Bedrock response as JSON: {e}. Response: {response_text}"
-            )
+            logger.error("Bedrock response did not include a tool result: %s", content)
             announcement["services"] = []
             announcement["relevant"] = False
             return announcement
 
+        relevant = result.get("relevant", False)
+        announcement["services"] = result.get("services", [])
+        announcement["relevant"] = relevant
+        announcement["model_id"] = model_id
+
+        if relevant:
+            announcement["summary"] = result.get("summary", "")
+            logger.debug("Relevant announcement found: %s", announcement["title"])
+        else:
+            logger.debug("Irrelevant announcement: %s", announcement["title"])
+
+        return announcement
+
     except Exception as e:
         if "ThrottlingException" in str(e):
             _api_calls["throttled"] += 1
-            logger.warning(f"Throttled by Bedrock during processing: {e}")
+            logger.warning("Throttled by Bedrock during processing: %s", e)
         else:
             _api_calls["errors"] += 1
-            logger.error(f"Error calling Bedrock for processing: {e}", exc_info=True)
+            logger.error("Error calling Bedrock for processing: %s", e, exc_info=True)
 
         announcement["services"] = []
         announcement["relevant"] = False
@@ -159,20 +364,42 @@ def process_announcements_in_parallel(
     for key in _api_calls:
         _api_calls[key] = 0
 
+    # Create the shared client up front with a connection pool large enough
+    # that workers don't queue on urllib3's default pool of 10. The pool is fixed
+    # for the client's lifetime (e.g. a warm Lambda container), so it is sized
+    # from the configured worker count, not from this batch.
+    _get_bedrock_client(region, max_pool_connections=max(1, max_workers) * 2)
+
+    # Threads only wait on Bedrock, so never start more than there is work for;
+    # the effective ceiling is the model's TPS quota, not the thread count
+    max_workers = max(1, min(max_workers, len(announcements)))
+
     logger.debug(
-        f"Processing {len(announcements)} announcements with {max_workers} workers"
+        "Processing %d announcements with %d workers", len(announcements), max_workers
     )
 
-    # Process in parallel with ThreadPoolExecutor
+    # Build the invariant prompt prefix once for the whole batch
+    prompt_prefix = build_prompt_prefix(user_services)
+
+    process = partial(
+        process_announcement_with_bedrock,
+        prompt_prefix=prompt_prefix,
+        model_id=model_id,
+        region=region,
+        limiter=AdaptiveLimiter(max_workers),
+    )
+
+    # Process in parallel with ThreadPoolExecutor, collecting results as they
+    # finish but keeping them in feed order for display and notifications
+    processed_announcements = [None] * len(announcements)
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        processed_announcements = list(
-            executor.map(
-                lambda announcement: process_announcement_with_bedrock(
-                    announcement, user_services, model_id, region
-                ),
-                announcements,
-            )
-        )
+        futures = {
+            executor.submit(process, announcement): index
+            for index, announcement in enumerate(announcements)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            processed_announcements[futures[future]] = future.result()
+            logger.debug("Processed %d/%d announcements", done, len(announcements))
 
     # Separate relevant and non-relevant
     relevant_announcements = []
@@ -186,9 +413,13 @@ def process_announcements_in_parallel(
 
     # Log stats.. could eventually be exported as metrics in a later version
     logger.info(
-        f"Bedrock API usage: {_api_calls['total']} total calls "
-        f"({len(relevant_announcements)} relevant, {len(non_relevant_announcements)} non-relevant, "
-        f"{_api_calls['throttled']} throttled, {_api_calls['errors']} errors)"
+        "Bedrock API usage: %d total calls "
+        "(%d relevant, %d non-relevant, %d throttled, %d errors)",
+        _api_calls["total"],
+        len(relevant_announcements),
+        len(non_relevant_announcements),
+        _api_calls["throttled"],
+        _api_calls["errors"],
     )
 
     return relevant_announcements, non_relevant_announcements
@@ -5,19 +5,58 @@ Cost Explorer integration for AWS Feature Notifier.
 Uses AWS Cost Explorer API to identify services in use.
 """
 
+import threading
 import boto3
-from typing import Dict
+from botocore.config import Config
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 from personalized_aws_features.core.logger import logger
 
+# Cost Explorer client, created once and reused across calls
+_CE_CLIENT: Optional[Any] = None
+_CE_CLIENT_LOCK = threading.Lock()
+
+
+# Default services to add if they don't already exist.. this isn't exhaustive
+DEFAULT_SERVICES = (
+    "Amazon VPC",
+    "AWS CloudFormation",
+    "AWS Identity Management",
+    "AWS Single Sign-On",
+    "AWS STS",
+    "AWS Organizations",
+    "AWS Billing",
+    "AWS Cost Management",
+    "AWS Management Console",
+    "AWS Artifact",
+    "AWS Tag Editor",
+    "AWS Resource Access Manager",
+)
+
+
+def _get_ce_client() -> Any:
+    """Return the cached Cost Explorer client, creating it on first use."""
+    global _CE_CLIENT
+    with _CE_CLIENT_LOCK:
+        if _CE_CLIENT is None:
+            # Hardcoded to us-east-1 due to availability. Built on its own
+            # session: process_features creates it while the DynamoDB resource
+            # is created on another thread, and the default session is not
+            # thread-safe.
+            _CE_CLIENT = boto3.session.Session().client(
+                "ce",
+                "us-east-1",
+                config=Config(retries={"max_attempts": 10, "mode": "adaptive"}),
+            )
+        return _CE_CLIENT
+
 
 def get_services() -> Dict:
     """Get services from Cost Explorer API results."""
     logger.info("Fetching services from AWS Cost Explorer API")
 
     try:
-        # Hardcoded to us-east-1 due to availability
-        ce = boto3.client("ce", "us-east-1")
+        ce = _get_ce_client()
 
         # Calculate time period (current month)
         today = datetime.now()
@@ -26,29 +65,37 @@ def get_services() -> Dict:
 
         # Query Cost Explorer API for all billing data across accounts (if consolidated billing)
         # Otherwise, grab data for the current account only
-        response = ce.get_cost_and_usage(
-            TimePeriod={"Start": first_day, "End": tomorrow},
-            Granularity="MONTHLY",
-            Metrics=["UnblendedCost"],
-            GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+        query = {
+            "TimePeriod": {"Start": first_day, "End": tomorrow},
+            "Granularity": "MONTHLY",
+            "Metrics": ["UnblendedCost"],
+            "GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}],
+        }
+
+        # Dict keeps first-seen order while de-duplicating across pages
+        service_names = {}
+
+        # get_cost_and_usage has no boto3 paginator, so follow NextPageToken
+        while True:
+            response = ce.get_cost_and_usage(**query)
+
+            for result in response.get("ResultsByTime", []):
+                for group in result.get("Groups", []):
+                    if len(group["Keys"]) > 0:
+                        service_name = group["Keys"][0]
+                        if service_name:  # Skip empty service names
+                            service_names[service_name] = None
+
+            next_token = response.get("NextPageToken")
+            if not next_token:
+                break
+            query["NextPageToken"] = next_token
+
+        services_list = [{"service": name} for name in service_names]
+        logger.info(
+            f"Found {len(services_list)} unique service(s) in Cost Explorer data"
         )
 
-        services_list = []
-
-        # Process the results
-        if "ResultsByTime" in response and len(response["ResultsByTime"]) > 0:
-            groups = response["ResultsByTime"][0].get("Groups", [])
-
-            for group in groups:
-                if len(group["Keys"]) > 0:
-                    service_name = group["Keys"][0]
-                    if service_name:  # Skip empty service names
-                        services_list.append({"service": service_name})
-
-            logger.info(
-                f"Found {len(services_list)} unique service(s) in Cost Explorer data"
-            )
-
         # Create the services result dictionary
         services_result = {"services": services_list}
 
@@ -70,27 +117,10 @@ def add_default_services(services_dict: Dict) -> Dict:
     """Add some default AWS services likely in use but not appearing in billing (this is not exhaustive)."""
     logger.debug("Adding default services to the service list")
 
-    # List of default services to add if they don't already exist.. this isn't exhaustive
-    default_services = [
-        "Amazon VPC",
-        "AWS CloudFormation",
-        "AWS Identity Management",
-        "AWS Single Sign-On",
-        "AWS STS",
-        "AWS Organizations",
-        "AWS Billing",
-        "AWS Cost Management",
-        "AWS Management Console",
-        "AWS Artifact",
-        "AWS Tag Editor",
-        "AWS Resource Access Manager",
-    ]
-
     # Add default services if they don't exist (sanity check)
     existing_services = {s["service"] for s in services_dict["services"]}
-
-    for service_name in default_services:
-        if service_name not in existing_services:
-            services_dict["services"].append({"service": service_name})
+    services_dict["services"].extend(
+        {"service": name} for name in DEFAULT_SERVICES if name not in existing_services
+    )
 
     return services_dict
@@ -1,20 +1,46 @@
 #!/usr/bin/env python3
 """
-DynamoDB integration to track seen announcements.
+DynamoDB integration to track seen announcements and cache Bedrock verdicts.
 """
 
 import boto3
-from datetime import datetime
-from typing import Dict, List, Union, Any
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union, Any
 import hashlib
-import json
+import threading
+import time
 from personalized_aws_features.core.logger import logger
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_LIMIT = 100
+BATCH_GET_MAX_RETRIES = 5
+
+# Bedrock verdicts share the table under their own key namespace so they never
+# collide with seen announcement IDs; expires_at is the table's TTL attribute
+VERDICT_KEY_PREFIX = "verdict#"
+VERDICT_TTL_DAYS = 30
+
+_DESERIALIZER = TypeDeserializer()
+
+# Verified table resources keyed by (table_name, region)
+_TABLE_CACHE: Dict[Tuple[str, str], Any] = {}
+_TABLE_LOCK = threading.Lock()
+
+# Announcement IDs known to exist, keyed by (table_name, announcement_id).
+# Only positive results are cached: a saved announcement stays seen, while a
+# new one may be saved later in the same process (e.g. warm Lambda containers).
+_SEEN_CACHE: Set[Tuple[str, str]] = set()
+
 
 def get_dynamodb_table(table_name: str, region: str) -> Any:
     """
     Get the DynamoDB table for storing announcements.
 
+    The table resource is cached per (table_name, region) so repeated calls
+    (e.g. warm Lambda invocations) skip resource creation and the status check.
+
     Args:
         table_name: DynamoDB table name to use
         region: AWS region for DynamoDB
@@ -25,17 +51,27 @@ def get_dynamodb_table(table_name: str, region: str) -> Any:
     Raises:
         Exception: If table doesn't exist or can't be accessed
     """
-    logger.info(f"Getting DynamoDB table {table_name} in {region}")
+    logger.info("Getting DynamoDB table %s in %s", table_name, region)
 
+    cache_key = (table_name, region)
     try:
-        dynamodb = boto3.resource("dynamodb", region_name=region)
-        table = dynamodb.Table(table_name)
-        table.table_status  # Verify table exists
-        logger.debug(f"DynamoDB table status: '{table.table_status}'")
-        return table
+        with _TABLE_LOCK:
+            if cache_key not in _TABLE_CACHE:
+                # Own session: this runs alongside Cost Explorer client creation
+                # and the default session is not thread-safe
+                dynamodb = boto3.session.Session().resource(
+                    "dynamodb",
+                    region_name=region,
+                    config=Config(retries={"max_attempts": 10, "mode": "adaptive"}),
+                )
+                table = dynamodb.Table(table_name)
+                table.table_status  # Verify table exists
+                logger.debug("DynamoDB table status: '%s'", table.table_status)
+                _TABLE_CACHE[cache_key] = table
+            return _TABLE_CACHE[cache_key]
     except Exception as e:
-        logger.error(f"Failed to access DynamoDB table '{table_name}': {str(e)}")
-        logger.error(f"Did you create the table in the correct region?")
+        logger.error("Failed to access DynamoDB table '%s': %s", table_name, e)
+        logger.error("Did you create the table in the correct region?")
         raise
 
 
@@ -53,8 +89,51 @@ def generate_announcement_id(announcement: Dict) -> str:
     key_parts = [announcement.get("title", ""), announcement.get("link", "")]
     key_string = "|".join(key_parts)
 
-    # Create a hash of the key string
-    return hashlib.md5(key_string.encode()).hexdigest()
+    # 16-byte BLAKE2b digest keeps the 32-character hex ID format
+    return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+
+
+def _generate_legacy_announcement_id(announcement: Dict) -> str:
+    """Generate the MD5 announcement ID written by releases before BLAKE2b IDs."""
+    key_string = "|".join([announcement.get("title", ""), announcement.get("link", "")])
+    # Not a security use; without the flag FIPS builds refuse to create MD5
+    return hashlib.md5(key_string.encode(), usedforsecurity=False).hexdigest()
+
+
+def generate_verdict_key(announcement: Dict) -> str:
+    """
+    Generate the cache key for an announcement's Bedrock verdict.
+
+    The key is derived from the content the model sees (title and description),
+    so an edited announcement is classified again.
+
+    Args:
+        announcement: The announcement dictionary
+
+    Returns:
+        Verdict key string
+    """
+    key_parts = [announcement.get("title", ""), announcement.get("description", "")]
+    key_string = "|".join(key_parts)
+
+    digest = hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+    return f"{VERDICT_KEY_PREFIX}{digest}"
+
+
+def generate_prompt_digest(prompt_prefix: str) -> str:
+    """
+    Generate a digest of the Bedrock prompt prefix a verdict was made with.
+
+    The prefix contains the user's service list, so a verdict is only reused
+    while the services it was judged against are unchanged.
+
+    Args:
+        prompt_prefix: Prompt prefix from build_prompt_prefix
+
+    Returns:
+        Digest string
+    """
+    return hashlib.blake2b(prompt_prefix.encode(), digest_size=16).hexdigest()
 
 
 def save_announcement(
@@ -77,66 +156,255 @@ def save_announcement(
     if isinstance(announcements, dict):
         announcements = [announcements]
 
-    logger.info(f"Saving {len(announcements)} announcement(s) to DynamoDB")
-    for announcement in announcements:
-        try:
-            announcement_id = generate_announcement_id(announcement)
-
-            # Prepare item for DynamoDB
-            item = {
-                "announcement_id": announcement_id,
-                "title": announcement.get("title", ""),
-                "link": announcement.get("link", ""),
-                "datePosted": announcement.get("datePosted", ""),
-                "services": json.dumps(announcement.get("services", [])),
-                "processed_at": datetime.now().isoformat(),
-            }
+    logger.info("Saving %d announcement(s) to DynamoDB", len(announcements))
+    # Every item in one call shares the same timezone-aware processing stamp
+    processed_at = datetime.now(timezone.utc).isoformat()
+    queued_ids = []
+    try:
+        # batch_writer groups puts into BatchWriteItem calls of up to 25 items and
+        # resends unprocessed items; remaining items are flushed on exit
+        with table.batch_writer(overwrite_by_pkeys=["announcement_id"]) as batch:
+            for announcement in announcements:
+                announcement_id = generate_announcement_id(announcement)
 
-            # Save to DynamoDB
-            logger.debug(f"Saving announcement: {item['title']}")
-            table.put_item(Item=item)
-            results["success"] += 1
-        except Exception as e:
-            logger.error(f"Error saving announcement to DynamoDB: {e}", exc_info=True)
-            results["failure"] += 1
+                # Prepare item for DynamoDB
+                item = {
+                    "announcement_id": announcement_id,
+                    "title": announcement.get("title", ""),
+                    "link": announcement.get("link", ""),
+                    "datePosted": announcement.get("datePosted", ""),
+                    "services": list(announcement.get("services", [])),
+                    "processed_at": processed_at,
+                }
+
+                logger.debug("Queueing announcement: %s", item["title"])
+                batch.put_item(Item=item)
+                queued_ids.append(announcement_id)
+        results["success"] = len(queued_ids)
+        _SEEN_CACHE.update((table.name, i) for i in queued_ids)
+    except Exception as e:
+        logger.error("Error saving announcements to DynamoDB: %s", e, exc_info=True)
+        # Writes are flushed in batches, so which items landed is unknown
+        results["failure"] = len(announcements)
 
     logger.info(
-        f"Saved {results['success']} announcements, failed {results['failure']}"
+        "Saved %d announcements, failed %d", results["success"], results["failure"]
     )
     return results
 
 
-def is_announcement_seen(
-    announcement: Dict,
+def get_seen_ids(
+    announcements: List[Dict],
     table: Any,
-) -> bool:
+) -> Set[str]:
     """
-    Check if an announcement has been seen before.
+    Look up which announcements have been seen before using BatchGetItem.
 
     Args:
-        announcement: The announcement to check
+        announcements: The announcements to check
         table: DynamoDB table resource
 
     Returns:
-        True if announcement has been seen before, False otherwise
+        Set of announcement IDs that already exist in the table
     """
-    try:
+    seen_ids = set()
+    # Stored ID to look up -> current announcement ID it stands for
+    lookup_ids = {}
+
+    # IDs already known to be seen in this process need no network call
+    for announcement in announcements:
         announcement_id = generate_announcement_id(announcement)
-        logger.debug(f"Checking if announcement {announcement_id} exists")
+        if (table.name, announcement_id) in _SEEN_CACHE:
+            seen_ids.add(announcement_id)
+        else:
+            lookup_ids[announcement_id] = announcement_id
+            # Announcements saved before the switch to BLAKE2b are stored under
+            # their MD5 ID; looking both up avoids re-posting them after deploy
+            lookup_ids[_generate_legacy_announcement_id(announcement)] = announcement_id
 
-        # Check if item exists in DynamoDB
-        response = table.get_item(
-            Key={"announcement_id": announcement_id},
-            ProjectionExpression="announcement_id",
-        )
+    if not lookup_ids:
+        logger.debug("All %d seen announcement(s) served from cache", len(seen_ids))
+        return seen_ids
+
+    logger.debug("Checking %d announcement ID(s) in DynamoDB", len(lookup_ids))
+
+    try:
+        for item in _batch_get_items(table, list(lookup_ids), "announcement_id"):
+            seen_ids.add(lookup_ids[item["announcement_id"]])
+    except Exception as e:
+        logger.error("Error checking announcements in DynamoDB: %s", e, exc_info=True)
+        # Keep what was found so far; anything else is treated as new to avoid
+        # skipping potentially new announcements
+
+    _SEEN_CACHE.update((table.name, i) for i in seen_ids)
+    logger.debug("%d announcement(s) already seen", len(seen_ids))
+    return seen_ids
+
+
+def get_cached_verdicts(
+    announcements: List[Dict],
+    table: Any,
+    model_id: str,
+    prompt_digest: str,
+) -> Dict[str, Dict]:
+    """
+    Look up Bedrock verdicts cached by a previous run.
+
+    Args:
+        announcements: The announcements to look up
+        table: DynamoDB table resource
+        model_id: Only verdicts made by this model are returned
+        prompt_digest: Only verdicts made with this prompt prefix are returned
+
+    Returns:
+        Dictionary mapping verdict keys to relevant, services and summary values
+    """
+    verdict_keys = list(dict.fromkeys(generate_verdict_key(a) for a in announcements))
+    verdicts = {}
+
+    if not verdict_keys:
+        return verdicts
 
-        seen = "Item" in response
-        logger.debug(
-            f"Announcement {announcement_id} {'already seen' if seen else 'is new'}"
+    try:
+        for item in _batch_get_items(
+            table,
+            verdict_keys,
+            "#id, #relevant, #services, #summary, #model, #digest",
+            {
+                "#id": "announcement_id",
+                "#relevant": "relevant",
+                "#services": "services",
+                "#summary": "summary",
+                "#model": "model_id",
+                "#digest": "prompt_digest",
+            },
+        ):
+            if (
+                item.get("model_id") != model_id
+                or item.get("prompt_digest") != prompt_digest
+            ):
+                continue
+            verdicts[item["announcement_id"]] = {
+                "relevant": item.get("relevant", False),
+                "services": list(item.get("services", [])),
+                "summary": item.get("summary", ""),
+                "model_id": model_id,
+            }
+    except Exception as e:
+        logger.error(
+            "Error reading cached verdicts from DynamoDB: %s", e, exc_info=True
         )
-        return seen
+        # Anything not found is simply classified again
+
+    logger.info(
+        "Found %d cached Bedrock verdict(s) for %d announcement(s)",
+        len(verdicts),
+        len(verdict_keys),
+    )
+    return verdicts
+
+
+def save_verdicts(
+    announcements: List[Dict],
+    table: Any,
+    model_id: str,
+    prompt_digest: str,
+) -> Dict:
+    """
+    Cache Bedrock verdicts so later runs can skip classifying the same content.
+
+    Only announcements classified by model_id are saved; failed calls are left
+    out so they are retried next run.
+
+    Args:
+        announcements: Processed announcements
+        table: DynamoDB table resource
+        model_id: Bedrock model ID that produced the verdicts
+        prompt_digest: Digest of the prompt prefix the verdicts were made with
 
+    Returns:
+        Dictionary with success and failure counts
+    """
+    results = {"success": 0, "failure": 0}
+    classified = [a for a in announcements if a.get("model_id") == model_id]
+
+    if not classified:
+        return results
+
+    expires_at = int((datetime.now() + timedelta(days=VERDICT_TTL_DAYS)).timestamp())
+
+    logger.debug("Caching %d Bedrock verdict(s) in DynamoDB", len(classified))
+    try:
+        with table.batch_writer(overwrite_by_pkeys=["announcement_id"]) as batch:
+            for announcement in classified:
+                batch.put_item(
+                    Item={
+                        "announcement_id": generate_verdict_key(announcement),
+                        "relevant": announcement.get("relevant", False),
+                        "services": list(announcement.get("services", [])),
+                        "summary": announcement.get("summary", ""),
+                        "model_id": model_id,
+                        "prompt_digest": prompt_digest,
+                        "expires_at": expires_at,
+                    }
+                )
+        results["success"] = len(classified)
     except Exception as e:
-        logger.error(f"Error checking announcement in DynamoDB: {e}", exc_info=True)
-        # Return False in case of error to avoid skipping potentially new announcements
-        return False
+        logger.error("Error caching verdicts in DynamoDB: %s", e, exc_info=True)
+        results["failure"] = len(classified)
+
+    return results
+
+
+def _batch_get_items(
+    table: Any,
+    keys: List[str],
+    projection: str,
+    attribute_names: Optional[Dict[str, str]] = None,
+) -> Iterator[Dict]:
+    """
+    Yield items for the given announcement_id keys using BatchGetItem.
+
+    Keys are requested in chunks of BATCH_GET_LIMIT using eventually consistent
+    reads, and unprocessed keys are retried with exponential backoff.
+
+    Args:
+        table: DynamoDB table resource
+        keys: announcement_id values to fetch
+        projection: ProjectionExpression for the request
+        attribute_names: Optional ExpressionAttributeNames for the projection
+
+    Yields:
+        Deserialized items
+    """
+    client = table.meta.client
+
+    for start in range(0, len(keys), BATCH_GET_LIMIT):
+        chunk = keys[start : start + BATCH_GET_LIMIT]
+        # Eventually consistent reads cost half the capacity of strongly
+        # consistent ones; a record written moments ago is not needed here
+        request = {
+            "Keys": [{"announcement_id": {"S": k}} for k in chunk],
+            "ProjectionExpression": projection,
+            "ConsistentRead": False,
+        }
+        if attribute_names:
+            request["ExpressionAttributeNames"] = attribute_names
+        request_items = {table.name: request}
+
+        # Retry unprocessed keys with exponential backoff
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            response = client.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(table.name, []):
+                yield {k: _DESERIALIZER.deserialize(v) for k, v in item.items()}
+
+            request_items = response.get("UnprocessedKeys") or {}
+            if not request_items:
+                break
+            if attempt == BATCH_GET_MAX_RETRIES:
+                logger.warning(
+                    "Giving up on unprocessed DynamoDB keys after %d retries",
+                    BATCH_GET_MAX_RETRIES,
+                )
+                break
+            time.sleep(0.05 * 2**attempt)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session for AWS Feature Notifier.
+
+The RSS feed fetch and Slack posts go through one pooled requests.Session so
+keep-alive connections (and their TLS handshakes) are reused across calls.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Default timeout in seconds for outbound HTTP requests
+REQUEST_TIMEOUT = 10
+
+# Sized above the Slack worker count so concurrent posts never wait for a slot
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared, connection-pooled HTTP session.
+
+    Returns:
+        requests.Session instance
+    """
+    return _SESSION
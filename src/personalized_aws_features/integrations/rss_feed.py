@@ -5,15 +5,31 @@ AWS RSS Feed Parser
 Fetches and parses the AWS What's New RSS feed to find recent announcements.
 """
 
+import logging
 import re
 import feedparser
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List
 import html
+from collections import namedtuple
+from itertools import takewhile
 from personalized_aws_features.core.logger import logger
+from personalized_aws_features.integrations.http_client import (
+    REQUEST_TIMEOUT,
+    get_http_session,
+)
 
 RSS_FEED_URL = "https://aws.amazon.com/about-aws/whats-new/recent/feed/"
 
+# Compiled once at import instead of per feed entry. Any run of tags and
+# whitespace becomes a single space, so one pass handles both cleanups.
+_CLEAN_RE = re.compile(r"(?:<[^>]+>|\s)+")
+_WS_RE = re.compile(r"\s+")
+
+# Fields kept from each feedparser entry; published is the UTC
+# (year, month, day, hour, minute, second) prefix of published_parsed
+Entry = namedtuple("Entry", ["title", "link", "description", "published"])
+
 
 def fetch_aws_whats_new(days_back: int) -> List[Dict]:
     """
@@ -25,55 +41,121 @@ def fetch_aws_whats_new(days_back: int) -> List[Dict]:
     Returns:
         List of announcement dictionaries
     """
-    logger.info(f"Fetching AWS What's New feed for the last {days_back} day(s)")
-    # Calculate the cutoff date
-    cutoff_date = datetime.now() - timedelta(days=days_back)
-    logger.debug(f"Using cutoff date: {cutoff_date.isoformat()}")
+    logger.info("Fetching AWS What's New feed for the last %d day(s)", days_back)
+    # Calculate the cutoff date in UTC, the timezone of published_parsed
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Using cutoff date: %s", cutoff_date.isoformat())
 
-    # Fetch the RSS feed
-    feed_url = RSS_FEED_URL
-    logger.debug(f"Fetching RSS feed from {feed_url}")
-    feed = feedparser.parse(feed_url)
+    entries = _parse_feed(RSS_FEED_URL)
 
-    if hasattr(feed, "bozo_exception") and feed.bozo_exception:
-        logger.warning(f"Warning while parsing feed: {feed.bozo_exception}")
+    # Compare struct_time fields as plain tuples so old entries are rejected
+    # without building a datetime for them
+    cutoff_tuple = cutoff_date.timetuple()[:6]
 
-    announcements = []
-    total_entries = len(feed.entries)
-    logger.debug(f"Found {total_entries} entries in the AWS What's New feed")
+    # The AWS feed is ordered newest first, so the first entry older than the
+    # cutoff ends the window. If that ordering ever changes, takewhile must be
+    # replaced with a filter over every entry.
+    recent_entries = takewhile(lambda entry: entry.published >= cutoff_tuple, entries)
+    announcements = [_entry_to_dict(entry) for entry in _unique_by_link(recent_entries)]
 
-    for entry in feed.entries:
-        date_posted = datetime(*entry.published_parsed[:6])
+    logger.debug(
+        "Found %d announcements within the %d day window",
+        len(announcements),
+        days_back,
+    )
+    return announcements
 
-        # Skip if the announcement is older than the cutoff date
-        if date_posted < cutoff_date:
-            logger.debug(f"Skipping old announcement from {date_posted.isoformat()}")
-            continue
 
-        # Extract basic information
-        title = entry.title
-        link = entry.link
-        description = entry.get("description", "")
+def _parse_feed(feed_url: str) -> List[Entry]:
+    """
+    Fetch and parse the RSS feed into lightweight entries.
 
-        # Clean HTML from description
-        if description:
-            # Remove HTML tags but preserve content
-            description = re.sub(r"<[^>]+>", " ", description)
-            description = html.unescape(description)
-            description = re.sub(r"\s+", " ", description).strip()
+    Only the fields used downstream are kept, so feedparser's full result is
+    released when this function returns rather than held for the whole run.
 
-        logger.debug(f"Processing announcement: {title}")
+    Args:
+        feed_url: URL of the RSS feed
 
-        announcement = {
-            "title": title,
-            "description": description,
-            "link": link,
-            "datePosted": date_posted.isoformat(),
-        }
+    Returns:
+        List of Entry tuples in feed order
+    """
+    logger.debug("Fetching RSS feed from %s", feed_url)
+    # Fetch over the shared pooled session so the request has a timeout and
+    # HTTP errors surface, then let feedparser parse the bytes
+    response = get_http_session().get(feed_url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    feed = feedparser.parse(response.content)
+
+    if feed.bozo:
+        logger.warning("Warning while parsing feed: %s", feed.bozo_exception)
+
+    logger.debug("Found %d entries in the AWS What's New feed", len(feed.entries))
+    return [
+        Entry(
+            title=entry.title,
+            link=entry.link,
+            description=entry.get("description", ""),
+            published=tuple(entry.published_parsed[:6]),
+        )
+        for entry in feed.entries
+    ]
+
+
+def _unique_by_link(entries: Iterable) -> Iterator:
+    """
+    Yield feed entries whose link has not been seen earlier in the feed.
 
-        announcements.append(announcement)
+    Republished announcements would otherwise be classified, stored and
+    notified more than once in the same run.
 
-    logger.debug(
-        f"Found {len(announcements)} announcements within the {days_back} day window"
-    )
-    return announcements
+    Args:
+        entries: Feed entries
+
+    Yields:
+        The first entry for each distinct link
+    """
+    seen_links = set()
+    for entry in entries:
+        link = entry.link
+        if link in seen_links:
+            logger.debug("Skipping duplicate announcement: %s", link)
+            continue
+        seen_links.add(link)
+        yield entry
+
+
+def _entry_to_dict(entry) -> Dict:
+    """
+    Convert a feed entry into an announcement dictionary.
+
+    Args:
+        entry: Feed entry inside the lookback window
+
+    Returns:
+        Announcement dictionary with a cleaned, plain-text description
+    """
+    title = entry.title
+    description = entry.description
+
+    # Clean HTML from description
+    if description:
+        # Remove HTML tags but preserve content. Plain text with only single
+        # spaces is common and would come back unchanged, so skip the pass;
+        # every whitespace character other than a space is non-printable.
+        if "<" in description or "  " in description or not description.isprintable():
+            description = _CLEAN_RE.sub(" ", description)
+        # Most descriptions have no entities; unescaping can introduce
+        # whitespace (e.g. &nbsp;), so collapse again only in that case
+        if "&" in description:
+            description = _WS_RE.sub(" ", html.unescape(description))
+        description = description.strip()
+
+    logger.debug("Processing announcement: %s", title)
+
+    return {
+        "title": title,
+        "description": description,
+        "link": entry.link,
+        "datePosted": datetime(*entry.published).isoformat(),
+    }
@@ -5,12 +5,42 @@ Slack integration for AWS Feature Notifier.
 Sends AWS service announcements to a Slack channel.
 """
 
-import requests
 import json
-from typing import Dict, List
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
 from personalized_aws_features.core.logger import logger
+from personalized_aws_features.integrations.http_client import (
+    REQUEST_TIMEOUT,
+    get_http_session,
+)
 
 SLACK_API_URL = "https://slack.com/api/chat.postMessage"
+# Kept small so bursts stay within Slack's chat.postMessage rate limit
+SLACK_MAX_WORKERS = 8
+# Slack rejects messages with more than 50 blocks
+SLACK_MAX_BLOCKS = 50
+# Each announcement renders as 4 blocks, plus a divider between announcements
+ANNOUNCEMENTS_PER_MESSAGE = (SLACK_MAX_BLOCKS + 1) // 5
+
+# Retries for a message that Slack rate limits (HTTP 429), and the longest
+# Retry-After delay honoured before giving up on the wait
+SLACK_RATE_LIMIT_RETRIES = 2
+SLACK_MAX_RETRY_AFTER = 30
+
+# Slack errors caused by the message content. Only these are worth resending
+# one announcement at a time; transport, rate limit and server errors would
+# fail the same way for every announcement in the batch.
+SLACK_CONTENT_ERRORS = frozenset(
+    {"invalid_blocks", "invalid_blocks_format", "msg_too_long"}
+)
+
+DIVIDER_BLOCK = {"type": "divider"}
+
+# "Title:"/"Summary:" prefixes that the model sometimes adds to its summary.
+# Bold markers around them are removed in a second step, once the prefix is gone.
+_SUMMARY_STRIP_RE = re.compile(r"(?:Title|Summary):")
 
 
 def send_to_slack(
@@ -20,36 +50,137 @@ def send_to_slack(
 ) -> bool:
     """Send an AWS service announcement to a Slack channel."""
     try:
-        logger.debug(f"Preparing Slack message for: {announcement['title']}")
+        logger.debug("Preparing Slack message for: %s", announcement["title"])
         blocks = format_slack_blocks(announcement)
 
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",
-            "Authorization": f"Bearer {slack_token}",
-        }
+        if _post_blocks(blocks, slack_token, slack_channel) is not None:
+            return False
+
+        logger.debug("Successfully sent to Slack: %s", announcement["title"])
+        return True
+
+    except Exception as e:
+        logger.error("Error sending to Slack: %s", e, exc_info=True)
+        return False
+
+
+def send_batch_to_slack(
+    announcements: List[Dict],
+    slack_token: str,
+    slack_channel: str,
+) -> Dict:
+    """
+    Send several announcements to Slack as one message.
+
+    The announcements' blocks are joined with dividers into a single
+    chat.postMessage call. If Slack rejects the message content (see
+    SLACK_CONTENT_ERRORS), each announcement is retried as its own message so
+    one bad entry does not drop the whole batch. Any other failure counts
+    against every announcement in the batch.
+
+    Args:
+        announcements: Announcements to send, at most ANNOUNCEMENTS_PER_MESSAGE
+        slack_token: Slack API token
+        slack_channel: Slack channel to post to
+
+    Returns:
+        Dictionary with success and failure counts
+    """
+    if len(announcements) == 1:
+        success = send_to_slack(announcements[0], slack_token, slack_channel)
+        return {"success": int(success), "failure": int(not success)}
+
+    try:
+        blocks = []
+        for announcement in announcements:
+            if blocks:
+                blocks.append(DIVIDER_BLOCK)
+            blocks.extend(format_slack_blocks(announcement))
+
+        error = _post_blocks(blocks, slack_token, slack_channel)
+
+    except Exception as e:
+        logger.error("Error sending batch to Slack: %s", e, exc_info=True)
+        return {"success": 0, "failure": len(announcements)}
+
+    if error is None:
+        logger.debug("Sent %d announcements in one Slack message", len(announcements))
+        return {"success": len(announcements), "failure": 0}
+
+    if error not in SLACK_CONTENT_ERRORS:
+        return {"success": 0, "failure": len(announcements)}
+
+    logger.warning(
+        "Slack rejected the batched message (%s), sending %d announcements "
+        "individually",
+        error,
+        len(announcements),
+    )
+    results = {"success": 0, "failure": 0}
+    for announcement in announcements:
+        if send_to_slack(announcement, slack_token, slack_channel):
+            results["success"] += 1
+        else:
+            results["failure"] += 1
+    return results
+
 
-        payload = {"channel": slack_channel, "blocks": blocks}
+def _post_blocks(
+    blocks: List[Dict], slack_token: str, slack_channel: str
+) -> Optional[str]:
+    """
+    Post one message made of the given blocks to a Slack channel.
+
+    Args:
+        blocks: Slack block objects for the message
+        slack_token: Slack API token
+        slack_channel: Slack channel to post to
 
-        logger.debug(f"Sending to Slack channel: {slack_channel}")
-        response = requests.post(
+    Returns:
+        None if Slack accepted the message, otherwise the Slack error code
+        (or "http_<status>" for a non-200 response)
+
+    Raises:
+        requests.RequestException: If the request itself fails
+    """
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "Authorization": f"Bearer {slack_token}",
+    }
+
+    payload = {"channel": slack_channel, "blocks": blocks}
+    # Compact UTF-8 encoding: no padding whitespace or \u escapes
+    data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+
+    for attempt in range(SLACK_RATE_LIMIT_RETRIES + 1):
+        logger.debug("Sending to Slack channel: %s", slack_channel)
+        response = get_http_session().post(
             SLACK_API_URL,
             headers=headers,
-            data=json.dumps(payload),
+            data=data,
+            timeout=REQUEST_TIMEOUT,
         )
 
-        # Check response
-        result = response.json()
-        if not result.get("ok", False):
-            error = result.get("error", "Unknown error")
-            logger.error(f"Error sending to Slack: {error}")
-            return False
+        # Rate limited: wait as long as Slack asks, then try again
+        if response.status_code == 429 and attempt < SLACK_RATE_LIMIT_RETRIES:
+            delay = _retry_after(response)
+            logger.warning("Slack rate limited the request, retrying in %ds", delay)
+            time.sleep(delay)
+            continue
+        break
 
-        logger.debug(f"Successfully sent to Slack: {announcement['title']}")
-        return True
+    # Only a 200 carries a JSON body worth parsing
+    if response.status_code != 200:
+        logger.error("Slack HTTP %s: %s", response.status_code, response.text[:200])
+        return f"http_{response.status_code}"
 
-    except Exception as e:
-        logger.error(f"Error sending to Slack: {e}", exc_info=True)
-        return False
+    result = response.json()
+    if not result.get("ok", False):
+        error = result.get("error", "Unknown error")
+        logger.error("Error sending to Slack: %s", error)
+        return error
+
+    return None
 
 
 def format_slack_blocks(announcement: Dict) -> List[Dict]:
@@ -62,10 +193,17 @@ def format_slack_blocks(announcement: Dict) -> List[Dict]:
     Returns:
         List of Slack block objects
     """
-    blocks = []
+    # Clean up the summary text, removing any "Title:" or "Summary:"
+    # prefixes, then the bold markers they leave behind (e.g. "*Summary:*")
+    summary = announcement.get("summary", "No summary available.")
+    summary = _SUMMARY_STRIP_RE.sub("", summary).replace("**", "").strip()
 
-    # Title as header (no prefix)
-    blocks.append(
+    # Wrap each service in backticks with one join instead of a per-item f-string
+    services = announcement["services"]
+    service_text = f"`{'`, `'.join(services)}`" if services else ""
+
+    return [
+        # Title as header (no prefix)
         {
             "type": "header",
             "text": {
@@ -73,40 +211,21 @@ def format_slack_blocks(announcement: Dict) -> List[Dict]:
                 "text": announcement["title"],
                 "emoji": True,
             },
-        }
-    )
-
-    # Clean up the summary text
-    summary = announcement.get("summary", "No summary available.")
-
-    # Remove any "Title:" or "Summary:" prefixes from the Bedrock output
-    summary = summary.replace("Title:", "").replace("Summary:", "")
-    summary = summary.replace("**Title:**", "").replace("**Summary:**", "")
-    summary = summary.replace("**", "")  # Remove any remaining bold markers
-    summary = summary.strip()  # Remove leading/trailing whitespace
-
-    # Summary section
-    blocks.append(
+        },
+        # Summary section
         {
             "type": "section",
             "text": {"type": "mrkdwn", "text": f"*Summary:*\n{summary}"},
-        }
-    )
-
-    # Service info section
-    service_text = ", ".join([f"`{service}`" for service in announcement["services"]])
-    blocks.append(
+        },
+        # Service info section
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
                 "text": f"*Mentioned Services:* {service_text}",
             },
-        }
-    )
-
-    # Link button
-    blocks.append(
+        },
+        # Link button
         {
             "type": "actions",
             "elements": [
@@ -120,10 +239,8 @@ def format_slack_blocks(announcement: Dict) -> List[Dict]:
                     "url": announcement["link"],
                 }
             ],
-        }
-    )
-
-    return blocks
+        },
+    ]
 
 
 def send_announcements_to_slack(
@@ -143,19 +260,53 @@ def send_announcements_to_slack(
         Dictionary with success and failure counts
     """
     logger.info(
-        f"Sending {len(announcements)} announcements to Slack channel {slack_channel}"
+        "Sending %d announcements to Slack channel %s",
+        len(announcements),
+        slack_channel,
     )
     results = {"success": 0, "failure": 0}
+    if not announcements:
+        return results
 
-    for announcement in announcements:
-        success = send_to_slack(announcement, slack_token, slack_channel)
+    # Group announcements into as few messages as the block limit allows
+    batches = [
+        announcements[i : i + ANNOUNCEMENTS_PER_MESSAGE]
+        for i in range(0, len(announcements), ANNOUNCEMENTS_PER_MESSAGE)
+    ]
 
-        if success:
-            results["success"] += 1
-        else:
-            results["failure"] += 1
+    # Posts are I/O bound, so overlap them; messages may arrive out of order
+    max_workers = min(SLACK_MAX_WORKERS, len(batches))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(send_batch_to_slack, batch, slack_token, slack_channel)
+            for batch in batches
+        ]
+
+        for future in as_completed(futures):
+            batch_results = future.result()
+            results["success"] += batch_results["success"]
+            results["failure"] += batch_results["failure"]
 
     logger.info(
-        f"Slack results: {results['success']} sent successfully, {results['failure']} failed"
+        "Slack results: %d sent successfully, %d failed",
+        results["success"],
+        results["failure"],
     )
     return results
+
+
+def _retry_after(response) -> int:
+    """
+    Read the Retry-After delay from a rate-limited Slack response.
+
+    Args:
+        response: HTTP response with status 429
+
+    Returns:
+        Seconds to wait, capped at SLACK_MAX_RETRY_AFTER
+    """
+    try:
+        delay = int(response.headers.get("Retry-After", 1))
+    except ValueError:
+        delay = 1
+    return max(0, min(delay, SLACK_MAX_RETRY_AFTER))
@@ -5,21 +5,30 @@ Lambda handler for Personalized AWS Features.
 
 import os
 import json
+from functools import lru_cache
+from typing import Dict
 from personalized_aws_features.core.processor import process_features
 from personalized_aws_features.core.logger import setup_logging, logger
 
+# Log level applied by the previous invocation in this container
+_LOG_LEVEL = None
 
-def lambda_handler(event, context):
+
+@lru_cache(maxsize=1)
+def _load_config() -> Dict:
     """
-    AWS Lambda handler for Personalized AWS Features.
+    Build the configuration from environment variables.
+
+    The environment is fixed for the lifetime of a Lambda container, so this
+    runs once per cold start and warm invocations reuse the result.
     """
-    # Get configuration from environment variables
-    config = {
+    return {
         "days": int(os.environ.get("DAYS_BACK", "7")),
         "workers": int(os.environ.get("MAX_WORKERS", "10")),
         "model": os.environ.get("BEDROCK_MODEL", "amazon.nova-lite-v1:0"),
         "region": os.environ.get("APP_AWS_REGION", "us-east-1"),
         "no_history": os.environ.get("NO_HISTORY", "false").lower() == "true",
+        "prefilter": os.environ.get("PREFILTER", "false").lower() == "true",
         "ddb_table": os.environ.get("DDB_TABLE", "personalized-aws-features"),
         "verbose": os.environ.get("VERBOSE", "false").lower() == "true",
         "slack_enabled": os.environ.get("SLACK_ENABLED", "false").lower() == "true",
@@ -28,7 +37,19 @@ def lambda_handler(event, context):
         "log_level": os.environ.get("LOG_LEVEL", "INFO"),
     }
 
-    setup_logging(log_level=config["log_level"])
+
+def lambda_handler(event, context):
+    """
+    AWS Lambda handler for Personalized AWS Features.
+    """
+    global _LOG_LEVEL
+
+    # Copy so a caller mutating its config cannot alter the cached one
+    config = dict(_load_config())
+
+    if config["log_level"] != _LOG_LEVEL:
+        setup_logging(log_level=config["log_level"])
+        _LOG_LEVEL = config["log_level"]
 
     try:
         # Process features using the core processor
@@ -41,15 +62,17 @@ def lambda_handler(event, context):
                 {
                     "message": "AWS Feature Notifier executed successfully",
                     "result": result,
-                }
+                },
+                separators=(",", ":"),
             ),
         }
     except Exception as e:
-        logger.error(f"Error executing AWS Feature Notifier: {e}", exc_info=True)
+        logger.error("Error executing AWS Feature Notifier: %s", e, exc_info=True)
 
         return {
             "statusCode": 500,
             "body": json.dumps(
-                {"message": "Error executing AWS Feature Notifier", "error": str(e)}
+                {"message": "Error executing AWS Feature Notifier", "error": str(e)},
+                separators=(",", ":"),
             ),
         }
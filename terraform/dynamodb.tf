@@ -9,6 +9,12 @@ resource "aws_dynamodb_table" "aws_feature_announcements_ddb_table" {
     name = "announcement_id"
     type = "S"
   }
+
+  # Expires cached Bedrock verdicts; seen announcements have no expires_at
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
   tags = {
     Name = "personalized-aws-features"
   }
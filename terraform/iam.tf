@@ -124,7 +124,9 @@ resource "aws_iam_policy" "ddb_access_policy" {
       {
         Action = [
           "dynamodb:GetItem",
+          "dynamodb:BatchGetItem",
           "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:DescribeTable"
         ]
         Effect   = "Allow"
@@ -23,6 +23,7 @@ resource "aws_lambda_function" "personalized_aws_features" {
       APP_AWS_REGION = var.aws_region
       LOG_LEVEL      = var.log_level
       NO_HISTORY     = var.create_dynamodb ? "false" : "true"
+      PREFILTER      = tostring(var.prefilter_enabled)
       SLACK_ENABLED  = tostring(var.slack_enabled)
       SLACK_TOKEN    = var.slack_token
       SLACK_CHANNEL  = var.slack_channel
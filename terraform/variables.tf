@@ -82,6 +82,12 @@ variable "max_workers" {
   default     = 10
 }
 
+variable "prefilter_enabled" {
+  description = "Skip the Bedrock call for announcements that mention none of the used services"
+  type        = bool
+  default     = false
+}
+
 variable "log_level" {
   description = "Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
   type        = string
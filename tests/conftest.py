@@ -4,69 +4,85 @@ Shared pytest fixtures for AWS Feature Notifier unit tests.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import DEFAULT, MagicMock, patch
 from datetime import datetime, timedelta
 
 
-@pytest.fixture
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+@pytest.fixture(scope="session")
 def sample_config():
-    """Sample configuration for tests."""
-    return {
-        "days": 7,
-        "workers": 5,
-        "model": "amazon.nova-lite-v1:0",
-        "region": "us-east-1",
-        "no_history": False,
-        "ddb_table": "test-table",
-        "verbose": True,
-        "slack_enabled": False,
-        "log_level": "INFO",
-    }
+    """Sample configuration for tests (read-only, shared by all tests)."""
+    return freeze(
+        {
+            "days": 7,
+            "workers": 5,
+            "model": "amazon.nova-lite-v1:0",
+            "region": "us-east-1",
+            "no_history": False,
+            "ddb_table": "test-table",
+            "verbose": True,
+            "slack_enabled": False,
+            "log_level": "INFO",
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_services():
-    """Sample AWS services for tests."""
-    return {
-        "services": [
-            {"service": "Amazon EC2"},
-            {"service": "Amazon S3"},
-            {"service": "Amazon RDS"},
-            {"service": "AWS Lambda"},
-            {"service": "Amazon VPC"},
-        ]
-    }
+    """Sample AWS services for tests (read-only, shared by all tests)."""
+    return freeze(
+        {
+            "services": [
+                {"service": "Amazon EC2"},
+                {"service": "Amazon S3"},
+                {"service": "Amazon RDS"},
+                {"service": "AWS Lambda"},
+                {"service": "Amazon VPC"},
+            ]
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_announcements():
-    """Sample AWS announcements for tests."""
+    """Sample AWS announcements for tests (read-only, shared by all tests)."""
     current_time = datetime.now()
-    return [
-        {
-            "title": "AWS Lambda now supports Python 3.13",
-            "description": "AWS Lambda now supports Python 3.13 runtime.",
-            "link": "https://aws.amazon.com/about-aws/whats-new/2025/03/aws-lambda-python-3-13/",
-            "datePosted": current_time.isoformat(),
-        },
-        {
-            "title": "Amazon EC2 introduces new instance types",
-            "description": "Amazon EC2 introduces new high-performance instance types.",
-            "link": "https://aws.amazon.com/about-aws/whats-new/2025/03/amazon-ec2-instance-types/",
-            "datePosted": (current_time - timedelta(days=1)).isoformat(),
-        },
-        {
-            "title": "Amazon CloudFront adds new edge locations",
-            "description": "Amazon CloudFront adds new edge locations in Europe.",
-            "link": "https://aws.amazon.com/about-aws/whats-new/2025/03/amazon-cloudfront-edge-locations/",
-            "datePosted": (current_time - timedelta(days=2)).isoformat(),
-        },
-    ]
+    return freeze(
+        [
+            {
+                "title": "AWS Lambda now supports Python 3.13",
+                "description": "AWS Lambda now supports Python 3.13 runtime.",
+                "link": "https://aws.amazon.com/about-aws/whats-new/2025/03/aws-lambda-python-3-13/",
+                "datePosted": current_time.isoformat(),
+            },
+            {
+                "title": "Amazon EC2 introduces new instance types",
+                "description": "Amazon EC2 introduces new high-performance instance types.",
+                "link": "https://aws.amazon.com/about-aws/whats-new/2025/03/amazon-ec2-instance-types/",
+                "datePosted": (current_time - timedelta(days=1)).isoformat(),
+            },
+            {
+                "title": "Amazon CloudFront adds new edge locations",
+                "description": "Amazon CloudFront adds new edge locations in Europe.",
+                "link": "https://aws.amazon.com/about-aws/whats-new/2025/03/amazon-cloudfront-edge-locations/",
+                "datePosted": (current_time - timedelta(days=2)).isoformat(),
+            },
+        ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_processed_announcements(sample_announcements):
-    """Sample processed AWS announcements for tests."""
+    """Sample processed AWS announcements for tests (read-only, shared)."""
     processed = []
 
     # Lambda announcement (relevant)
@@ -98,7 +114,7 @@ def sample_processed_announcements(sample_announcements):
         }
     )
 
-    return processed
+    return freeze(processed)
 
 
 @pytest.fixture
@@ -118,8 +134,8 @@ def mock_processor_dependencies():
             "personalized_aws_features.core.processor.get_dynamodb_table"
         ) as mock_get_table,
         patch(
-            "personalized_aws_features.core.processor.is_announcement_seen"
-        ) as mock_is_seen,
+            "personalized_aws_features.core.processor.get_seen_ids"
+        ) as mock_get_seen_ids,
         patch(
             "personalized_aws_features.core.processor.save_announcement"
         ) as mock_save,
@@ -146,7 +162,7 @@ def mock_processor_dependencies():
             "process_announcements": mock_process,
             "fetch_aws_whats_new": mock_fetch,
             "get_dynamodb_table": mock_get_table,
-            "is_announcement_seen": mock_is_seen,
+            "get_seen_ids": mock_get_seen_ids,
             "save_announcement": mock_save,
             "send_announcements_to_slack": mock_send_slack,
             "display_announcement_list": mock_display_list,
@@ -154,3 +170,21 @@ def mock_processor_dependencies():
             "display_service_summary": mock_display_summary,
             "dynamodb_table": mock_table,
         }
+
+
+@pytest.fixture
+def processor_mocks():
+    """Mocks the collaborators process_features calls, keyed by name."""
+    with patch.multiple(
+        "personalized_aws_features.core.processor",
+        setup_dynamodb=DEFAULT,
+        get_and_analyze_services=DEFAULT,
+        process_announcements=DEFAULT,
+        fetch_aws_whats_new=DEFAULT,
+        filter_seen_announcements=DEFAULT,
+        save_announcement=DEFAULT,
+        display_announcement_list=DEFAULT,
+        display_detailed_announcements=DEFAULT,
+        display_service_summary=DEFAULT,
+    ) as mocks:
+        yield mocks
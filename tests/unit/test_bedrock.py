@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bedrock.py
+"""
+
+import pytest
+import threading
+import time
+from unittest.mock import MagicMock, patch
+from personalized_aws_features.integrations.bedrock import (
+    AdaptiveLimiter,
+    CLASSIFY_TOOL_CONFIG,
+    CLASSIFY_TOOL_NAME,
+    FORCED_CLASSIFY_TOOL_CONFIG,
+    process_announcement_with_bedrock,
+    process_announcements_in_parallel,
+)
+
+
+def make_response(*content, retry_attempts=0):
+    """Build a Converse response with the given message content blocks."""
+    return {
+        "output": {"message": {"role": "assistant", "content": list(content)}},
+        "ResponseMetadata": {"RetryAttempts": retry_attempts},
+    }
+
+
+def make_announcement():
+    """Build a simple announcement for Bedrock tests."""
+    return {
+        "title": "AWS Lambda adds a new runtime",
+        "description": "Lambda now supports a new runtime.",
+    }
+
+
+class TestBedrock:
+    """Tests for the Bedrock integration."""
+
+    @patch("personalized_aws_features.integrations.bedrock._get_bedrock_client")
+    def test_process_announcement_extracts_tool_use(self, mock_get_client):
+        """Test the verdict is read from the toolUse block of the response."""
+        mock_get_client.return_value.converse.return_value = make_response(
+            {"text": "Classifying the announcement."},
+            {
+                "toolUse": {
+                    "toolUseId": "tool-1",
+                    "name": CLASSIFY_TOOL_NAME,
+                    "input": {
+                        "relevant": True,
+                        "services": ["AWS Lambda"],
+                        "summary": "Lambda adds a runtime.",
+                    },
+                }
+            },
+        )
+
+        result = process_announcement_with_bedrock(
+            make_announcement(), "prefix", model_id="amazon.nova-lite-v1:0"
+        )
+
+        assert result["relevant"] is True
+        assert result["services"] == ["AWS Lambda"]
+        assert result["summary"] == "Lambda adds a runtime."
+        assert result["model_id"] == "amazon.nova-lite-v1:0"
+
+    @patch("personalized_aws_features.integrations.bedrock._get_bedrock_client")
+    def test_process_announcement_missing_tool_result(self, mock_get_client):
+        """Test a response without a toolUse block is treated as not relevant."""
+        mock_get_client.return_value.converse.return_value = make_response(
+            {"text": "The announcement is about AWS Lambda."}
+        )
+
+        result = process_announcement_with_bedrock(
+            make_announcement(), "prefix", model_id="amazon.nova-lite-v1:0"
+        )
+
+        assert result["relevant"] is False
+        assert result["services"] == []
+        # Without a model_id the verdict is not cached and is retried next run
+        assert "model_id" not in result
+
+    @patch("personalized_aws_features.integrations.bedrock._get_bedrock_client")
+    def test_process_announcement_supported_model_fields(self, mock_get_client):
+        """Test prompt caching and forced tool choice are sent to Nova models."""
+        converse = mock_get_client.return_value.converse
+        converse.return_value = make_response()
+
+        process_announcement_with_bedrock(
+            make_announcement(), "prefix", model_id="us.amazon.nova-lite-v1:0"
+        )
+
+        kwargs = converse.call_args.kwargs
+        assert {"cachePoint": {"type": "default"}} in kwargs["messages"][0]["content"]
+        assert kwargs["toolConfig"] is FORCED_CLASSIFY_TOOL_CONFIG
+
+    @patch("personalized_aws_features.integrations.bedrock._get_bedrock_client")
+    def test_process_announcement_claude_3_haiku_no_cache_point(self, mock_get_client):
+        """Test Claude models without prompt caching get no cache point."""
+        converse = mock_get_client.return_value.converse
+        converse.return_value = make_response()
+
+        process_announcement_with_bedrock(
+            make_announcement(),
+            "prefix",
+            model_id="anthropic.claude-3-haiku-20240307-v1:0",
+        )
+
+        kwargs = converse.call_args.kwargs
+        content = kwargs["messages"][0]["content"]
+        assert all("cachePoint" not in block for block in content)
+        assert kwargs["toolConfig"] is FORCED_CLASSIFY_TOOL_CONFIG
+
+    @patch("personalized_aws_features.integrations.bedrock._get_bedrock_client")
+    def test_process_announcement_unsupported_model_fields(self, mock_get_client):
+        """Test other models are sent neither a cache point nor a tool choice."""
+        converse = mock_get_client.return_value.converse
+        converse.return_value = make_response()
+
+        process_announcement_with_bedrock(
+            make_announcement(), "prefix", model_id="meta.llama3-70b-instruct-v1:0"
+        )
+
+        kwargs = converse.call_args.kwargs
+        content = kwargs["messages"][0]["content"]
+        assert all("cachePoint" not in block for block in content)
+        assert kwargs["toolConfig"] is CLASSIFY_TOOL_CONFIG
+        assert "toolChoice" not in kwargs["toolConfig"]
+
+    @patch("personalized_aws_features.integrations.bedrock._get_bedrock_client")
+    def test_process_in_parallel_sizes_pool_from_workers(self, mock_get_client):
+        """Test a small first batch does not shrink the client's connection pool."""
+        mock_get_client.return_value.converse.return_value = make_response()
+
+        process_announcements_in_parallel(
+            [make_announcement()], {"services": []}, "amazon.nova-lite-v1:0", 10
+        )
+
+        mock_get_client.assert_any_call("us-east-1", max_pool_connections=20)
+
+    def test_adaptive_limiter_halves_on_retried_response(self):
+        """Test a response that needed botocore retries halves the limit."""
+        limiter = AdaptiveLimiter(8)
+
+        limiter.call(MagicMock(return_value=make_response(retry_attempts=2)))
+
+        assert limiter.limit == 4
+
+    def test_adaptive_limiter_halves_on_throttling_exception(self):
+        """Test a raised ThrottlingException halves the limit and is re-raised."""
+        limiter = AdaptiveLimiter(8)
+        throttled = MagicMock(side_effect=Exception("ThrottlingException: slow down"))
+
+        with pytest.raises(Exception, match="ThrottlingException"):
+            limiter.call(throttled)
+
+        assert limiter.limit == 4
+
+    def test_adaptive_limiter_grows_back_to_max(self):
+        """Test successful calls grow the limit additively, capped at the maximum."""
+        limiter = AdaptiveLimiter(4)
+        limiter.call(MagicMock(return_value=make_response(retry_attempts=1)))
+        assert limiter.limit == 2
+
+        # Each success adds 1/limit: 2 -> 2.5 -> 2.9 -> 3.24
+        succeed = MagicMock(return_value=make_response())
+        for _ in range(3):
+            limiter.call(succeed)
+        assert limiter.limit == 3
+
+        for _ in range(20):
+            limiter.call(succeed)
+        assert limiter.limit == 4
+
+    def test_adaptive_limiter_bounds_calls_in_flight(self):
+        """Test no more calls than the limit run at the same time."""
+        limiter = AdaptiveLimiter(2)
+        release = threading.Event()
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def blocking_call():
+            with lock:
+                active.append(None)
+                peak.append(len(active))
+            release.wait(timeout=5)
+            with lock:
+                active.pop()
+            return make_response()
+
+        threads = [
+            threading.Thread(target=limiter.call, args=(blocking_call,))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+
+        deadline = time.monotonic() + 5
+        while len(peak) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Give the third thread a chance to get past the limiter if it could
+        time.sleep(0.05)
+        assert len(peak) == 2
+
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert len(peak) == 3
+        assert max(peak) == 2
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Unit tests for cost_explorer.py
+"""
+
+import pytest
+from unittest.mock import patch
+from personalized_aws_features.integrations.cost_explorer import (
+    DEFAULT_SERVICES,
+    get_services,
+)
+
+
+def make_page(*services, next_token=None):
+    """Build a get_cost_and_usage response grouped by SERVICE."""
+    page = {
+        "ResultsByTime": [
+            {"Groups": [{"Keys": [service]} for service in services]},
+        ]
+    }
+    if next_token:
+        page["NextPageToken"] = next_token
+    return page
+
+
+class TestCostExplorer:
+    """Tests for the Cost Explorer integration."""
+
+    @patch("personalized_aws_features.integrations.cost_explorer._get_ce_client")
+    def test_get_services_follows_next_page_token(self, mock_get_client):
+        """Test every page is requested and services are de-duplicated."""
+        get_cost_and_usage = mock_get_client.return_value.get_cost_and_usage
+        get_cost_and_usage.side_effect = [
+            make_page("AWS Lambda", "Amazon Simple Storage Service", next_token="p2"),
+            make_page("Amazon Simple Storage Service", "", "Amazon DynamoDB"),
+        ]
+
+        result = get_services()
+
+        services = [s["service"] for s in result["services"]]
+        assert services[:3] == [
+            "AWS Lambda",
+            "Amazon Simple Storage Service",
+            "Amazon DynamoDB",
+        ]
+        assert services[3:] == [s for s in DEFAULT_SERVICES if s not in services[:3]]
+        calls = get_cost_and_usage.call_args_list
+        assert len(calls) == 2
+        assert "NextPageToken" not in calls[0].kwargs
+        assert calls[1].kwargs["NextPageToken"] == "p2"
+
+    @patch("personalized_aws_features.integrations.cost_explorer._get_ce_client")
+    def test_get_services_error(self, mock_get_client):
+        """Test API errors are raised as RuntimeError."""
+        mock_get_client.return_value.get_cost_and_usage.side_effect = Exception(
+            "AccessDenied"
+        )
+
+        with pytest.raises(RuntimeError, match="AccessDenied"):
+            get_services()
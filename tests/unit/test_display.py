@@ -3,6 +3,7 @@
 Unit tests for display.py
 """
 
+import pytest
 from unittest.mock import patch, call
 from personalized_aws_features.core.display import (
     display_announcement_list,
@@ -14,53 +15,44 @@ from personalized_aws_features.core.display import (
 class TestDisplayFunctions:
     """Tests for display functions."""
 
+    @pytest.mark.parametrize(
+        "announcements,expected_calls",
+        [
+            # Nothing is printed for an empty list
+            ([], []),
+            (
+                [
+                    {"title": "Announcement 1", "services": ["AWS Lambda", "Python"]},
+                    {"title": "Announcement 2", "services": ["Amazon EC2"]},
+                ],
+                [
+                    call("\nTest Announcements:\n"),
+                    call("  1. Announcement 1"),
+                    call("     [Services detected: AWS Lambda, Python]\n"),
+                    call("  2. Announcement 2"),
+                    call("     [Services detected: Amazon EC2]\n"),
+                ],
+            ),
+            (
+                [
+                    {"title": "Announcement 1", "link": "link1"},
+                    {"title": "Announcement 2", "link": "link2"},
+                ],
+                [
+                    call("\nTest Announcements:\n"),
+                    call("  1. Announcement 1"),
+                    call("  2. Announcement 2"),
+                ],
+            ),
+        ],
+        ids=["empty", "with_services", "without_services"],
+    )
     @patch("builtins.print")
-    def test_display_announcement_list_empty(self, mock_print):
-        """Test display_announcement_list with empty announcements."""
-        display_announcement_list("Test Title", [])
-
-        # Should not print anything for empty announcements
-        mock_print.assert_not_called()
-
-    @patch("builtins.print")
-    def test_display_announcement_list_with_services(
-        self, mock_print, sample_processed_announcements
-    ):
-        """Test display_announcement_list with announcements that have services."""
-        # Only use the relevant announcements that have services
-        relevant = [
-            a for a in sample_processed_announcements if a.get("relevant", False)
-        ]
-
-        display_announcement_list("Relevant Announcements", relevant)
-
-        # Check that the title and each announcement was printed
-        calls = [call("\nRelevant Announcements:\n")]
-        for i, announcement in enumerate(relevant, 1):
-            calls.append(call(f"  {i}. {announcement['title']}"))
-            services_str = ", ".join(announcement.get("services", []))
-            calls.append(call(f"     [Services detected: {services_str}]\n"))
-
-        mock_print.assert_has_calls(calls)
-
-    @patch("builtins.print")
-    def test_display_announcement_list_without_services(self, mock_print):
-        """Test display_announcement_list with announcements that don't have services."""
-        announcements = [
-            {"title": "Announcement 1", "link": "link1"},
-            {"title": "Announcement 2", "link": "link2"},
-        ]
-
+    def test_display_announcement_list(self, mock_print, announcements, expected_calls):
+        """Test display_announcement_list output for each announcement shape."""
         display_announcement_list("Test Announcements", announcements)
 
-        # Check that the title and each announcement was printed
-        calls = [
-            call("\nTest Announcements:\n"),
-            call("  1. Announcement 1"),
-            call("  2. Announcement 2"),
-        ]
-
-        mock_print.assert_has_calls(calls)
+        assert mock_print.call_args_list == expected_calls
 
     @patch("personalized_aws_features.core.display.logger")
     def test_display_detailed_announcements_empty(self, mock_logger):
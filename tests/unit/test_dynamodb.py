@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Unit tests for dynamodb.py
+"""
+
+import hashlib
+from unittest.mock import MagicMock, patch
+from personalized_aws_features.integrations.dynamodb import (
+    BATCH_GET_MAX_RETRIES,
+    _SEEN_CACHE,
+    _TABLE_CACHE,
+    _batch_get_items,
+    generate_announcement_id,
+    generate_verdict_key,
+    get_cached_verdicts,
+    get_dynamodb_table,
+    get_seen_ids,
+    save_announcement,
+    save_verdicts,
+)
+
+
+def make_table(*responses):
+    """Build a table stub whose client returns the given BatchGetItem responses."""
+    table = MagicMock()
+    table.name = "test-table"
+    table.meta.client.batch_get_item.side_effect = list(responses)
+    return table
+
+
+def make_announcement(title):
+    """Build a simple announcement for DynamoDB tests."""
+    return {"title": title, "link": f"https://aws.amazon.com/{title}/"}
+
+
+def make_verdict_item(announcement, model_id="test-model", prompt_digest="digest"):
+    """Build a cached verdict item in DynamoDB's wire format."""
+    return {
+        "announcement_id": {"S": generate_verdict_key(announcement)},
+        "relevant": {"BOOL": True},
+        "services": {"L": [{"S": "AWS Lambda"}]},
+        "summary": {"S": f"Summary of {announcement['title']}"},
+        "model_id": {"S": model_id},
+        "prompt_digest": {"S": prompt_digest},
+    }
+
+
+class TestDynamoDB:
+    """Tests for the DynamoDB integration."""
+
+    def setup_method(self):
+        """Start every test without IDs cached by earlier tests."""
+        _SEEN_CACHE.clear()
+
+    @patch("personalized_aws_features.integrations.dynamodb.boto3.session.Session")
+    def test_get_dynamodb_table_own_session(self, mock_session):
+        """Test the table resource is built on its own session and cached."""
+        _TABLE_CACHE.clear()
+        resource = mock_session.return_value.resource
+
+        first = get_dynamodb_table("test-table", "us-east-1")
+        second = get_dynamodb_table("test-table", "us-east-1")
+
+        assert first is second is resource.return_value.Table.return_value
+        mock_session.assert_called_once_with()
+        resource.assert_called_once()
+        _TABLE_CACHE.clear()
+
+    def test_get_seen_ids_matches_legacy_md5_ids(self):
+        """Test announcements stored under their pre-BLAKE2b MD5 ID count as seen."""
+        legacy, current, new = (make_announcement(t) for t in ("old", "cur", "new"))
+        legacy_id = hashlib.md5(
+            f"{legacy['title']}|{legacy['link']}".encode()
+        ).hexdigest()
+        table = make_table(
+            {
+                "Responses": {
+                    "test-table": [
+                        {"announcement_id": {"S": legacy_id}},
+                        {"announcement_id": {"S": generate_announcement_id(current)}},
+                    ]
+                }
+            }
+        )
+
+        seen_ids = get_seen_ids([legacy, current, new], table)
+
+        assert seen_ids == {
+            generate_announcement_id(legacy),
+            generate_announcement_id(current),
+        }
+        request = table.meta.client.batch_get_item.call_args.kwargs["RequestItems"]
+        assert len(request["test-table"]["Keys"]) == 6
+
+    def test_save_announcement_batch(self):
+        """Test announcements are written in one batch with the expected items."""
+        announcements = [
+            dict(
+                make_announcement(t),
+                datePosted="2025-01-01T00:00:00",
+                services=("AWS Lambda",),
+                summary="Not stored",
+            )
+            for t in ("a", "b")
+        ]
+        table = make_table()
+        batch = table.batch_writer.return_value.__enter__.return_value
+
+        results = save_announcement(announcements, table)
+
+        assert results == {"success": 2, "failure": 0}
+        table.batch_writer.assert_called_once_with(
+            overwrite_by_pkeys=["announcement_id"]
+        )
+        items = [c.kwargs["Item"] for c in batch.put_item.call_args_list]
+        assert set(items[0]) == {
+            "announcement_id",
+            "title",
+            "link",
+            "datePosted",
+            "services",
+            "processed_at",
+        }
+        assert items[0]["announcement_id"] == generate_announcement_id(announcements[0])
+        # Stored as a native list rather than a tuple or serialized string
+        assert items[0]["services"] == ["AWS Lambda"]
+        # One UTC stamp shared by every item in the call
+        stamps = {item["processed_at"] for item in items}
+        assert len(stamps) == 1
+        assert stamps.pop().endswith("+00:00")
+        assert _SEEN_CACHE == {
+            ("test-table", generate_announcement_id(a)) for a in announcements
+        }
+
+    def test_save_announcement_single(self):
+        """Test a single announcement dictionary is accepted."""
+        table = make_table()
+
+        results = save_announcement(make_announcement("a"), table)
+
+        assert results == {"success": 1, "failure": 0}
+
+    def test_save_announcement_flush_error(self):
+        """Test a failed flush counts every announcement and caches none."""
+        table = make_table()
+        table.batch_writer.return_value.__exit__.side_effect = Exception(
+            "ProvisionedThroughputExceededException"
+        )
+
+        results = save_announcement(
+            [make_announcement("a"), make_announcement("b")], table
+        )
+
+        assert results == {"success": 0, "failure": 2}
+        assert _SEEN_CACHE == set()
+
+    def test_get_cached_verdicts_matches_model_and_prompt(self):
+        """Test verdicts from another model or service list are not reused."""
+        current, other_model, other_prompt = (
+            make_announcement(t) for t in ("current", "model", "prompt")
+        )
+        table = make_table(
+            {
+                "Responses": {
+                    "test-table": [
+                        make_verdict_item(current),
+                        make_verdict_item(other_model, model_id="other-model"),
+                        make_verdict_item(other_prompt, prompt_digest="other"),
+                    ]
+                }
+            }
+        )
+
+        verdicts = get_cached_verdicts(
+            [current, other_model, other_prompt], table, "test-model", "digest"
+        )
+
+        assert verdicts == {
+            generate_verdict_key(current): {
+                "relevant": True,
+                "services": ["AWS Lambda"],
+                "summary": "Summary of current",
+                "model_id": "test-model",
+            }
+        }
+
+    def test_get_cached_verdicts_error(self):
+        """Test a failed lookup returns no verdicts instead of raising."""
+        table = make_table(Exception("Service unavailable"))
+
+        verdicts = get_cached_verdicts(
+            [make_announcement("a")], table, "test-model", "digest"
+        )
+
+        assert verdicts == {}
+
+    def test_save_verdicts_only_classified(self):
+        """Test only verdicts made by the model are saved, with the prompt digest."""
+        classified = dict(
+            make_announcement("classified"),
+            relevant=False,
+            services=["Amazon S3"],
+            model_id="test-model",
+        )
+        failed = dict(make_announcement("failed"), relevant=False, services=[])
+        table = make_table()
+        batch = table.batch_writer.return_value.__enter__.return_value
+
+        results = save_verdicts([classified, failed], table, "test-model", "digest")
+
+        assert results == {"success": 1, "failure": 0}
+        batch.put_item.assert_called_once()
+        item = batch.put_item.call_args.kwargs["Item"]
+        assert item["announcement_id"] == generate_verdict_key(classified)
+        assert item["services"] == ["Amazon S3"]
+        assert item["model_id"] == "test-model"
+        assert item["prompt_digest"] == "digest"
+        assert isinstance(item["expires_at"], int)
+
+    @patch("personalized_aws_features.integrations.dynamodb.time.sleep")
+    def test_batch_get_items_retries_unprocessed_keys(self, mock_sleep):
+        """Test unprocessed keys are requested again and items are deserialized."""
+        unprocessed = {"test-table": {"Keys": [{"announcement_id": {"S": "b"}}]}}
+        table = make_table(
+            {
+                "Responses": {"test-table": [{"announcement_id": {"S": "a"}}]},
+                "UnprocessedKeys": unprocessed,
+            },
+            {"Responses": {"test-table": [{"announcement_id": {"S": "b"}}]}},
+        )
+
+        items = list(_batch_get_items(table, ["a", "b"], "announcement_id"))
+
+        assert items == [{"announcement_id": "a"}, {"announcement_id": "b"}]
+        calls = table.meta.client.batch_get_item.call_args_list
+        assert calls[1].kwargs["RequestItems"] == unprocessed
+        mock_sleep.assert_called_once()
+
+    @patch("personalized_aws_features.integrations.dynamodb.time.sleep")
+    def test_batch_get_items_gives_up_after_retries(self, mock_sleep):
+        """Test keys still unprocessed after the last retry are dropped."""
+        unprocessed = {"test-table": {"Keys": [{"announcement_id": {"S": "a"}}]}}
+        table = make_table(
+            *[{"UnprocessedKeys": unprocessed}] * (BATCH_GET_MAX_RETRIES + 1)
+        )
+
+        assert list(_batch_get_items(table, ["a"], "announcement_id")) == []
+        assert table.meta.client.batch_get_item.call_count == BATCH_GET_MAX_RETRIES + 1
+        assert mock_sleep.call_count == BATCH_GET_MAX_RETRIES
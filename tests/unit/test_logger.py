@@ -6,9 +6,19 @@ Unit tests for logger.py
 import logging
 from unittest.mock import patch
 import os
+import pytest
+import personalized_aws_features.core.logger as logger_module
 from personalized_aws_features.core.logger import setup_logging, logger
 
 
+@pytest.fixture(autouse=True)
+def reset_logging_state():
+    """Make every test start from an unconfigured logger."""
+    logger_module._configured = False
+    yield
+    logger_module._configured = False
+
+
 class TestLogger:
     """Tests for the logger module."""
 
@@ -62,3 +72,13 @@ class TestLogger:
 
         assert result == logger
         assert logger.level == logging.INFO
+
+    @patch("logging.basicConfig")
+    def test_setup_logging_configures_once(self, mock_basic_config):
+        """Test repeated setup_logging calls only update the level."""
+        setup_logging("INFO")
+        result = setup_logging("DEBUG")
+
+        assert result == logger
+        assert logger.level == logging.DEBUG
+        mock_basic_config.assert_called_once()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit tests for prefilter.py
+"""
+
+import pytest
+from personalized_aws_features.core.prefilter import (
+    service_keywords,
+    build_service_pattern,
+    prefilter_announcements,
+)
+
+
+class TestPrefilter:
+    """Tests for the prefilter module."""
+
+    def test_service_keywords_strips_prefix_and_usage_suffix(self):
+        """Test service_keywords with a Cost Explorer style name."""
+        keywords = service_keywords("Amazon Elastic Compute Cloud - Compute")
+
+        assert keywords == {
+            "elastic compute cloud",
+            "ec2",
+            "ebs",
+            "elastic block store",
+        }
+
+    @pytest.mark.parametrize(
+        "service_name,title",
+        [
+            (
+                "Amazon Elastic Container Service for Kubernetes",
+                "Amazon EKS now supports Kubernetes version 1.33",
+            ),
+            ("Amazon Elastic MapReduce", "Amazon EMR Serverless adds job retries"),
+            ("AWS Database Migration Service", "AWS DMS adds new target endpoints"),
+            (
+                "Amazon Managed Streaming for Apache Kafka",
+                "Amazon MSK Connect now supports new connectors",
+            ),
+            ("EC2 - Other", "Amazon EBS increases gp3 volume throughput"),
+            (
+                "Amazon Elastic Compute Cloud - Compute",
+                "Amazon EBS snapshots now support faster restores",
+            ),
+            (
+                "Amazon EC2 Container Registry (ECR)",
+                "Amazon ECR adds pull-through cache",
+            ),
+            ("AWS Identity Management", "AWS IAM launches new condition keys"),
+            ("AWS Single Sign-On", "IAM Identity Center adds session management"),
+        ],
+    )
+    def test_build_service_pattern_cost_explorer_names(self, service_name, title):
+        """Test real service names match the abbreviations announcements use."""
+        pattern = build_service_pattern({"services": [{"service": service_name}]})
+
+        assert pattern.search(title)
+
+    def test_service_keywords_without_space_after_prefix(self):
+        """Test service_keywords with names like AmazonCloudWatch."""
+        assert "cloudwatch" in service_keywords("AmazonCloudWatch")
+
+    def test_service_keywords_parenthesized_abbreviation(self):
+        """Test service_keywords picks up abbreviations in parentheses."""
+        keywords = service_keywords("Amazon Simple Queue Service (SQS)")
+
+        assert "sqs" in keywords
+        assert "simple queue service" in keywords
+
+    def test_build_service_pattern_no_services(self):
+        """Test build_service_pattern returns None without services."""
+        assert build_service_pattern({"services": []}) is None
+
+    def test_build_service_pattern_matches_whole_words(self, sample_services):
+        """Test build_service_pattern matches names but not substrings."""
+        pattern = build_service_pattern(sample_services)
+
+        assert pattern.search("Amazon EC2 introduces new instance types")
+        assert pattern.search("AWS LAMBDA adds a runtime")
+        assert not pattern.search("Amazon CloudFront adds new edge locations")
+        assert not pattern.search("Improved ec2x tooling")
+
+    def test_prefilter_announcements(self, sample_announcements, sample_services):
+        """Test prefilter_announcements rejects announcements without matches."""
+        announcements = [dict(a) for a in sample_announcements]
+
+        candidates, rejected = prefilter_announcements(announcements, sample_services)
+
+        assert candidates == announcements[:2]
+        assert rejected == [announcements[2]]
+        assert rejected[0]["relevant"] is False
+        assert rejected[0]["services"] == []
+
+    def test_prefilter_announcements_no_pattern(self, sample_announcements):
+        """Test prefilter_announcements keeps everything when nothing can match."""
+        candidates, rejected = prefilter_announcements(
+            sample_announcements, {"services": []}
+        )
+
+        assert candidates == sample_announcements
+        assert rejected == []
@@ -4,16 +4,39 @@ Unit tests for processor.py
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from contextlib import nullcontext
+from types import MappingProxyType
+from unittest.mock import MagicMock, sentinel
+from personalized_aws_features.core import processor
 from personalized_aws_features.core.processor import (
     initialize_results,
     setup_dynamodb,
     get_and_analyze_services,
-    fetch_and_process_announcements,
+    process_announcements,
     filter_seen_announcements,
     send_slack_notifications,
     process_features,
 )
+from personalized_aws_features.integrations.bedrock import build_prompt_prefix
+from personalized_aws_features.integrations.dynamodb import (
+    generate_announcement_id,
+    generate_prompt_digest,
+    generate_verdict_key,
+)
+
+# Runs on the "fast" CI lane; the other unit modules run on the "not fast" lane
+pytestmark = pytest.mark.fast
+
+# Read-only mock payloads shared by every test
+_SLACK_SUCCESS = MappingProxyType({"success": 3, "failure": 0})
+_SLACK_FAILURE = MappingProxyType({"success": 1, "failure": 2})
+_EXPECTED_SERVICE_LIST = (
+    "AWS Lambda",
+    "Amazon EC2",
+    "Amazon RDS",
+    "Amazon S3",
+    "Amazon VPC",
+)
 
 
 class TestProcessorFunctions:
@@ -28,77 +51,176 @@ class TestProcessorFunctions:
         assert results["relevant_count"] == 0
         assert results["filtered_history_count"] == 0
 
-    @patch("personalized_aws_features.core.processor.get_dynamodb_table")
-    def test_setup_dynamodb_enabled(self, mock_get_table):
+    def test_setup_dynamodb_enabled(self, monkeypatch):
         """Test setup_dynamodb with history enabled."""
-        mock_table = MagicMock()
+        mock_get_table = MagicMock()
+        monkeypatch.setattr(processor, "get_dynamodb_table", mock_get_table)
+        mock_table = sentinel.ddb_table
         mock_get_table.return_value = mock_table
 
         result = setup_dynamodb("test-table", "us-east-1", False)
 
-        assert result == mock_table
+        assert result is mock_table
         mock_get_table.assert_called_once_with(
             table_name="test-table", region="us-east-1"
         )
 
-    @patch("personalized_aws_features.core.processor.get_dynamodb_table")
-    def test_setup_dynamodb_disabled(self, mock_get_table):
+    def test_setup_dynamodb_disabled(self, monkeypatch):
         """Test setup_dynamodb with history disabled."""
+        mock_get_table = MagicMock()
+        monkeypatch.setattr(processor, "get_dynamodb_table", mock_get_table)
+
         result = setup_dynamodb("test-table", "us-east-1", True)
 
         assert result is None
         mock_get_table.assert_not_called()
 
-    @patch("personalized_aws_features.core.processor.get_services")
-    def test_get_and_analyze_services(self, mock_get_services, sample_services):
+    def test_get_and_analyze_services(self, monkeypatch, sample_services):
         """Test get_and_analyze_services function."""
+        mock_get_services = MagicMock()
+        monkeypatch.setattr(processor, "get_services", mock_get_services)
         mock_get_services.return_value = sample_services
 
         user_services, service_count, services_list = get_and_analyze_services()
 
         assert user_services == sample_services
         assert service_count == 5
-        assert services_list == [
-            "AWS Lambda",
-            "Amazon EC2",
-            "Amazon RDS",
-            "Amazon S3",
-            "Amazon VPC",
-        ]
-
-    @patch("personalized_aws_features.core.processor.process_announcements_in_parallel")
-    @patch("personalized_aws_features.core.processor.fetch_aws_whats_new")
-    def test_fetch_and_process_announcements(
-        self, mock_fetch, mock_process, sample_announcements, sample_services
+        assert tuple(services_list) == _EXPECTED_SERVICE_LIST
+
+    def test_process_announcements(
+        self, monkeypatch, sample_announcements, sample_services
     ):
-        """Test fetch_and_process_announcements function."""
-        mock_fetch.return_value = sample_announcements
+        """Test process_announcements function."""
+        mock_process = MagicMock()
+        monkeypatch.setattr(
+            processor, "process_announcements_in_parallel", mock_process
+        )
 
         # Mock relevant and non-relevant announcements
         relevant = [sample_announcements[0], sample_announcements[1]]
         non_relevant = [sample_announcements[2]]
         mock_process.return_value = (relevant, non_relevant)
 
-        result_relevant, result_non_relevant = fetch_and_process_announcements(
-            7, sample_services, "test-model", 5, "us-east-1"
+        result_relevant, result_non_relevant = process_announcements(
+            sample_announcements,
+            sample_services,
+            "test-model",
+            5,
+            "us-east-1",
+            prefilter=False,
         )
 
         assert result_relevant == relevant
         assert result_non_relevant == non_relevant
-        mock_fetch.assert_called_once_with(days_back=7)
         mock_process.assert_called_once_with(
             sample_announcements, sample_services, "test-model", 5, "us-east-1"
         )
 
-    @patch("personalized_aws_features.core.processor.is_announcement_seen")
+    def test_process_announcements_prefilter(
+        self, monkeypatch, sample_announcements, sample_services
+    ):
+        """Test process_announcements only sends prefilter matches to Bedrock."""
+        mock_process = MagicMock()
+        monkeypatch.setattr(
+            processor, "process_announcements_in_parallel", mock_process
+        )
+
+        announcements = [dict(a) for a in sample_announcements]
+        mock_process.return_value = (announcements[:2], [])
+
+        result_relevant, result_non_relevant = process_announcements(
+            announcements,
+            sample_services,
+            "test-model",
+            5,
+            "us-east-1",
+            prefilter=True,
+        )
+
+        assert result_relevant == announcements[:2]
+        assert result_non_relevant == [announcements[2]]
+        mock_process.assert_called_once_with(
+            announcements[:2], sample_services, "test-model", 5, "us-east-1"
+        )
+
+    def test_process_announcements_empty(self, monkeypatch, sample_services):
+        """Test process_announcements skips Bedrock when the feed is empty."""
+        mock_process = MagicMock()
+        monkeypatch.setattr(
+            processor, "process_announcements_in_parallel", mock_process
+        )
+
+        result = process_announcements(
+            [], sample_services, "test-model", 5, "us-east-1"
+        )
+
+        assert result == ([], [])
+        mock_process.assert_not_called()
+
+    def test_process_announcements_cached_verdicts(
+        self, monkeypatch, sample_announcements, sample_services
+    ):
+        """Test process_announcements only classifies uncached announcements."""
+        mock_process = MagicMock()
+        monkeypatch.setattr(
+            processor, "process_announcements_in_parallel", mock_process
+        )
+        mock_get_verdicts = MagicMock()
+        monkeypatch.setattr(processor, "get_cached_verdicts", mock_get_verdicts)
+        mock_save_verdicts = MagicMock()
+        monkeypatch.setattr(processor, "save_verdicts", mock_save_verdicts)
+
+        announcements = [dict(a) for a in sample_announcements]
+        mock_table = sentinel.ddb_table
+
+        # First announcement was classified by an earlier run
+        mock_get_verdicts.return_value = {
+            generate_verdict_key(announcements[0]): {
+                "relevant": True,
+                "services": ["AWS Lambda"],
+                "summary": "Cached summary",
+                "model_id": "test-model",
+            }
+        }
+        mock_process.return_value = ([], announcements[1:])
+
+        result_relevant, result_non_relevant = process_announcements(
+            announcements,
+            sample_services,
+            "test-model",
+            5,
+            "us-east-1",
+            prefilter=False,
+            ddb_table=mock_table,
+        )
+
+        assert result_relevant == [announcements[0]]
+        assert result_relevant[0]["summary"] == "Cached summary"
+        assert result_non_relevant == announcements[1:]
+        mock_process.assert_called_once_with(
+            announcements[1:], sample_services, "test-model", 5, "us-east-1"
+        )
+        prompt_digest = generate_prompt_digest(build_prompt_prefix(sample_services))
+        mock_get_verdicts.assert_called_once_with(
+            announcements, mock_table, "test-model", prompt_digest
+        )
+        mock_save_verdicts.assert_called_once_with(
+            announcements[1:], mock_table, "test-model", prompt_digest
+        )
+
     def test_filter_seen_announcements(
-        self, mock_is_seen, sample_processed_announcements
+        self, monkeypatch, sample_processed_announcements
     ):
         """Test filter_seen_announcements function."""
+        mock_get_seen_ids = MagicMock()
+        monkeypatch.setattr(processor, "get_seen_ids", mock_get_seen_ids)
+
         # First announcement is seen, others are new
-        mock_is_seen.side_effect = [True, False, False]
+        mock_get_seen_ids.return_value = {
+            generate_announcement_id(sample_processed_announcements[0])
+        }
 
-        mock_table = MagicMock()
+        mock_table = sentinel.ddb_table
         new_announcements, filtered_announcements = filter_seen_announcements(
             sample_processed_announcements, mock_table, True
         )
@@ -108,10 +230,13 @@ class TestProcessorFunctions:
         assert filtered_announcements[0] == sample_processed_announcements[0]
         assert new_announcements[0] == sample_processed_announcements[1]
         assert new_announcements[1] == sample_processed_announcements[2]
+        mock_get_seen_ids.assert_called_once_with(
+            sample_processed_announcements, mock_table
+        )
 
     def test_filter_seen_announcements_disabled(self, sample_processed_announcements):
         """Test filter_seen_announcements with history disabled."""
-        mock_table = MagicMock()
+        mock_table = sentinel.ddb_table
         new_announcements, filtered_announcements = filter_seen_announcements(
             sample_processed_announcements, mock_table, False
         )
@@ -119,156 +244,142 @@ class TestProcessorFunctions:
         assert new_announcements == sample_processed_announcements
         assert filtered_announcements == []
 
-    @patch("personalized_aws_features.core.processor.send_announcements_to_slack")
-    def test_send_slack_notifications_success(
-        self, mock_send, sample_processed_announcements
-    ):
-        """Test send_slack_notifications function success case."""
-        # Mock successful sending
-        mock_send.return_value = {"success": 3, "failure": 0}
-
-        results = {}
-        send_slack_notifications(
-            sample_processed_announcements, "test-token", "#test-channel", results
-        )
-
-        assert results["slack_success"] == 3
-        assert results["slack_failure"] == 0
-        mock_send.assert_called_once_with(
-            sample_processed_announcements, "test-token", "#test-channel"
-        )
-
-    @patch("personalized_aws_features.core.processor.send_announcements_to_slack")
-    def test_send_slack_notifications_failure(
-        self, mock_send, sample_processed_announcements
+    @pytest.mark.parametrize(
+        "send_result,expect_raises,expected",
+        [
+            (_SLACK_SUCCESS, nullcontext(), (3, 0)),
+            (_SLACK_FAILURE, pytest.raises(RuntimeError), (1, 2)),
+        ],
+        ids=["success", "failure"],
+    )
+    def test_send_slack_notifications(
+        self,
+        monkeypatch,
+        send_result,
+        expect_raises,
+        expected,
+        sample_processed_announcements,
     ):
-        """Test send_slack_notifications function failure case."""
-        # Mock failed sending
-        mock_send.return_value = {"success": 1, "failure": 2}
+        """Test send_slack_notifications records counts and raises on failures."""
+        mock_send = MagicMock()
+        monkeypatch.setattr(processor, "send_announcements_to_slack", mock_send)
+        mock_send.return_value = send_result
 
         results = {}
-        with pytest.raises(RuntimeError):
+        with expect_raises:
             send_slack_notifications(
                 sample_processed_announcements, "test-token", "#test-channel", results
             )
 
-        assert results["slack_success"] == 1
-        assert results["slack_failure"] == 2
+        assert (results["slack_success"], results["slack_failure"]) == expected
+        mock_send.assert_called_once_with(
+            sample_processed_announcements, "test-token", "#test-channel"
+        )
 
 
 class TestProcessFeatures:
     """Tests for the main process_features function."""
 
-    @patch("personalized_aws_features.core.processor.setup_dynamodb")
-    @patch("personalized_aws_features.core.processor.get_and_analyze_services")
-    @patch("personalized_aws_features.core.processor.fetch_and_process_announcements")
-    @patch("personalized_aws_features.core.processor.filter_seen_announcements")
-    @patch("personalized_aws_features.core.processor.save_announcement")
-    @patch("personalized_aws_features.core.processor.display_announcement_list")
-    @patch("personalized_aws_features.core.processor.display_detailed_announcements")
-    @patch("personalized_aws_features.core.processor.display_service_summary")
-    def test_process_features_success(
+    @pytest.mark.parametrize(
+        "relevant_idx,non_relevant_idx,filtered_idx,expected",
+        [
+            # Two relevant announcements, one of them already seen
+            (
+                [0, 1],
+                [2],
+                [0],
+                {
+                    "service_count": 5,
+                    "announcement_count": 3,
+                    "relevant_count": 2,
+                    "filtered_history_count": 1,
+                },
+            ),
+            # Nothing relevant in the feed
+            (
+                [],
+                [],
+                [],
+                {
+                    "service_count": 5,
+                    "announcement_count": 0,
+                    "relevant_count": 0,
+                    "filtered_history_count": 0,
+                },
+            ),
+        ],
+        ids=["success", "no_announcements"],
+    )
+    def test_process_features(
         self,
-        mock_display_summary,
-        mock_display_detailed,
-        mock_display_list,
-        mock_save,
-        mock_filter,
-        mock_fetch_process,
-        mock_get_services,
-        mock_setup_ddb,
+        processor_mocks,
+        relevant_idx,
+        non_relevant_idx,
+        filtered_idx,
+        expected,
         sample_config,
         sample_services,
         sample_processed_announcements,
     ):
-        """Test process_features function successful execution."""
+        """Test process_features counts, history filtering, saving and display."""
         # Setup mocks
-        mock_ddb = MagicMock()
-        mock_setup_ddb.return_value = mock_ddb
+        mock_ddb = sentinel.ddb
+        processor_mocks["setup_dynamodb"].return_value = mock_ddb
 
         # Service mocks
-        mock_get_services.return_value = (
+        processor_mocks["get_and_analyze_services"].return_value = (
             sample_services,
             5,
-            ["AWS Lambda", "Amazon EC2", "Amazon RDS", "Amazon S3", "Amazon VPC"],
+            _EXPECTED_SERVICE_LIST,
         )
 
         # Announcement mocks
-        relevant = [
-            sample_processed_announcements[0],
-            sample_processed_announcements[1],
-        ]
-        non_relevant = [sample_processed_announcements[2]]
-        mock_fetch_process.return_value = (relevant, non_relevant)
-
-        # Filtering mocks - one announcement is filtered out
-        filtered_relevant = [relevant[1]]
-        filtered_out = [relevant[0]]
-        mock_filter.return_value = (filtered_relevant, filtered_out)
-
-        # Call the function
-        results = process_features(sample_config)
-
-        # Verify the expected behavior and results
-        assert results["service_count"] == 5
-        assert results["announcement_count"] == 3
-        assert results["relevant_count"] == 2
-        assert results["filtered_history_count"] == 1
-
-        # Check function calls
-        mock_setup_ddb.assert_called_once()
-        mock_get_services.assert_called_once()
-        mock_fetch_process.assert_called_once()
-        mock_filter.assert_called_once()
-        mock_save.assert_called_once_with(filtered_relevant, mock_ddb)
-
-        # Check if display functions were called (verbose is True)
-        mock_display_summary.assert_called_once()
-        mock_display_list.assert_called()
-        mock_display_detailed.assert_called_once()
-
-    @patch("personalized_aws_features.core.processor.setup_dynamodb")
-    @patch("personalized_aws_features.core.processor.get_and_analyze_services")
-    @patch("personalized_aws_features.core.processor.fetch_and_process_announcements")
-    def test_process_features_no_announcements(
-        self,
-        mock_fetch_process,
-        mock_get_services,
-        mock_setup_ddb,
-        sample_config,
-        sample_services,
-    ):
-        """Test process_features function with no relevant announcements."""
-        # Setup mocks
-        mock_ddb = MagicMock()
-        mock_setup_ddb.return_value = mock_ddb
-
-        # Service mocks
-        mock_get_services.return_value = (
-            sample_services,
-            5,
-            ["AWS Lambda", "Amazon EC2", "Amazon RDS", "Amazon S3", "Amazon VPC"],
+        relevant = [sample_processed_announcements[i] for i in relevant_idx]
+        non_relevant = [sample_processed_announcements[i] for i in non_relevant_idx]
+        processor_mocks["process_announcements"].return_value = (
+            relevant,
+            non_relevant,
         )
 
-        # No relevant announcements
-        mock_fetch_process.return_value = ([], [])
+        # Filtering mocks - previously seen announcements are filtered out
+        filtered_out = [sample_processed_announcements[i] for i in filtered_idx]
+        filtered_relevant = [a for a in relevant if a not in filtered_out]
+        processor_mocks["filter_seen_announcements"].return_value = (
+            filtered_relevant,
+            filtered_out,
+        )
 
         # Call the function
         results = process_features(sample_config)
 
-        # Verify results
-        assert results["service_count"] == 5
-        assert results["announcement_count"] == 0
-        assert results["relevant_count"] == 0
+        # Verify the expected results
+        for key, value in expected.items():
+            assert results[key] == value
 
-    @patch("personalized_aws_features.core.processor.setup_dynamodb")
-    @patch("personalized_aws_features.core.processor.get_and_analyze_services")
-    def test_process_features_exception(
-        self, mock_get_services, mock_setup_ddb, sample_config
-    ):
+        # Check function calls
+        processor_mocks["setup_dynamodb"].assert_called_once()
+        processor_mocks["get_and_analyze_services"].assert_called_once()
+        processor_mocks["fetch_aws_whats_new"].assert_called_once_with(days_back=7)
+        processor_mocks["process_announcements"].assert_called_once()
+        processor_mocks["filter_seen_announcements"].assert_called_once()
+        processor_mocks["display_service_summary"].assert_called_once()
+
+        # Only new relevant announcements are saved and shown in detail
+        if filtered_relevant:
+            processor_mocks["save_announcement"].assert_called_once_with(
+                filtered_relevant, mock_ddb
+            )
+            processor_mocks["display_detailed_announcements"].assert_called_once()
+        else:
+            processor_mocks["save_announcement"].assert_not_called()
+            processor_mocks["display_detailed_announcements"].assert_not_called()
+
+    def test_process_features_exception(self, processor_mocks, sample_config):
         """Test process_features function with an exception."""
         # Setup mocks to raise an exception
-        mock_get_services.side_effect = Exception("Test error")
+        processor_mocks["get_and_analyze_services"].side_effect = Exception(
+            "Test error"
+        )
 
         # Call the function and expect an exception
         with pytest.raises(Exception):
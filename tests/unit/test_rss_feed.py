@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for rss_feed.py
+"""
+
+import pytest
+import time
+from unittest.mock import MagicMock, patch
+from personalized_aws_features.integrations.rss_feed import (
+    Entry,
+    _entry_to_dict,
+    fetch_aws_whats_new,
+)
+
+
+def make_feed(items):
+    """Build RSS bytes from (title, link, description, age_days) tuples."""
+    now = time.time()
+    entries = "".join(
+        f"<item><title>{title}</title><link>{link}</link>"
+        f"<description>{description}</description>"
+        "<pubDate>"
+        + time.strftime(
+            "%a, %d %b %Y %H:%M:%S +0000", time.gmtime(now - age_days * 86400)
+        )
+        + "</pubDate></item>"
+        for title, link, description, age_days in items
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>AWS</title>'
+        f"{entries}</channel></rss>"
+    ).encode()
+
+
+class TestRssFeed:
+    """Tests for the RSS feed parser."""
+
+    @patch("personalized_aws_features.integrations.rss_feed.get_http_session")
+    def test_fetch_aws_whats_new_window_and_duplicates(self, mock_get_session):
+        """Test entries past the cutoff and repeated links are dropped."""
+        mock_get_session.return_value.get.return_value = MagicMock(
+            content=make_feed(
+                [
+                    ("Lambda update", "https://aws.amazon.com/1", "New", 0),
+                    ("Lambda update again", "https://aws.amazon.com/1", "Dup", 1),
+                    ("EC2 update", "https://aws.amazon.com/2", "New", 2),
+                    ("Old update", "https://aws.amazon.com/3", "Old", 30),
+                ]
+            )
+        )
+
+        announcements = fetch_aws_whats_new(days_back=7)
+
+        assert [a["title"] for a in announcements] == ["Lambda update", "EC2 update"]
+        assert set(announcements[0]) == {"title", "description", "link", "datePosted"}
+
+    @patch("personalized_aws_features.integrations.rss_feed.get_http_session")
+    def test_fetch_aws_whats_new_cleans_description(self, mock_get_session):
+        """Test HTML tags, entities and whitespace are removed from descriptions."""
+        description = (
+            "&lt;p&gt;Hello  &amp;amp;&lt;br/&gt;\n&lt;b&gt;world&lt;/b&gt;&lt;/p&gt;"
+        )
+        mock_get_session.return_value.get.return_value = MagicMock(
+            content=make_feed([("Update", "https://aws.amazon.com/1", description, 0)])
+        )
+
+        announcements = fetch_aws_whats_new(days_back=7)
+
+        assert announcements[0]["description"] == "Hello & world"
+
+    @pytest.mark.parametrize(
+        "whitespace", ["  ", "\n", "\t", "\r", "\xa0", "\f", "\v", "\u2003"]
+    )
+    def test_entry_to_dict_normalizes_unicode_whitespace(self, whitespace):
+        """Test every whitespace character is collapsed, not just ASCII ones."""
+        entry = Entry(
+            "Update",
+            "https://aws.amazon.com/1",
+            f"Hello{whitespace}world",
+            (2025, 1, 1, 0, 0, 0),
+        )
+
+        assert _entry_to_dict(entry)["description"] == "Hello world"
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unit tests for slack.py
+"""
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from personalized_aws_features.integrations.slack import (
+    ANNOUNCEMENTS_PER_MESSAGE,
+    SLACK_MAX_BLOCKS,
+    SLACK_RATE_LIMIT_RETRIES,
+    _post_blocks,
+    format_slack_blocks,
+    send_announcements_to_slack,
+    send_batch_to_slack,
+)
+
+
+def make_announcements(count):
+    """Build simple relevant announcements for Slack tests."""
+    return [
+        {
+            "title": f"Announcement {i}",
+            "link": f"https://aws.amazon.com/about-aws/whats-new/{i}/",
+            "services": ["AWS Lambda"],
+            "summary": f"Summary {i}",
+        }
+        for i in range(count)
+    ]
+
+
+class TestSlack:
+    """Tests for the Slack integration."""
+
+    @patch("personalized_aws_features.integrations.slack._post_blocks")
+    def test_send_batch_to_slack_single_message(self, mock_post):
+        """Test a batch is posted as one message separated by dividers."""
+        mock_post.return_value = None
+        announcements = make_announcements(3)
+
+        results = send_batch_to_slack(announcements, "xoxb-test", "#test")
+
+        assert results == {"success": 3, "failure": 0}
+        mock_post.assert_called_once()
+        blocks = mock_post.call_args[0][0]
+        assert [b["type"] for b in blocks].count("divider") == 2
+        assert len(blocks) <= SLACK_MAX_BLOCKS
+
+    @patch("personalized_aws_features.integrations.slack._post_blocks")
+    def test_send_batch_to_slack_falls_back(self, mock_post):
+        """Test a batch with rejected content is resent one announcement at a time."""
+        # Batch is rejected, then the individual posts succeed, fail, succeed
+        mock_post.side_effect = ["invalid_blocks", None, "invalid_blocks", None]
+        announcements = make_announcements(3)
+
+        results = send_batch_to_slack(announcements, "xoxb-test", "#test")
+
+        assert results == {"success": 2, "failure": 1}
+        assert mock_post.call_count == 4
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            "http_500",
+            "http_429",
+            "channel_not_found",
+            requests.exceptions.ReadTimeout("Read timed out"),
+        ],
+        ids=["server_error", "rate_limited", "slack_error", "timeout"],
+    )
+    @patch("personalized_aws_features.integrations.slack._post_blocks")
+    def test_send_batch_to_slack_fails_whole_batch(self, mock_post, failure):
+        """Test non-content failures count against the batch without a fallback."""
+        if isinstance(failure, Exception):
+            mock_post.side_effect = failure
+        else:
+            mock_post.return_value = failure
+        announcements = make_announcements(3)
+
+        results = send_batch_to_slack(announcements, "xoxb-test", "#test")
+
+        assert results == {"success": 0, "failure": 3}
+        mock_post.assert_called_once()
+
+    @patch("personalized_aws_features.integrations.slack._post_blocks")
+    def test_send_announcements_to_slack_respects_block_limit(self, mock_post):
+        """Test announcements are split into messages under Slack's block limit."""
+        mock_post.return_value = None
+        announcements = make_announcements(ANNOUNCEMENTS_PER_MESSAGE + 1)
+
+        results = send_announcements_to_slack(announcements, "xoxb-test", "#test")
+
+        assert results == {"success": len(announcements), "failure": 0}
+        assert mock_post.call_count == 2
+        for call in mock_post.call_args_list:
+            assert len(call[0][0]) <= SLACK_MAX_BLOCKS
+
+    @patch("personalized_aws_features.integrations.slack.time.sleep")
+    @patch("personalized_aws_features.integrations.slack.get_http_session")
+    def test_post_blocks_retries_rate_limit(self, mock_get_session, mock_sleep):
+        """Test a 429 response is retried after the Retry-After delay."""
+        limited = MagicMock(status_code=429, headers={"Retry-After": "3"})
+        accepted = MagicMock(status_code=200)
+        accepted.json.return_value = {"ok": True}
+        mock_get_session.return_value.post.side_effect = [limited, accepted]
+
+        assert _post_blocks([], "xoxb-test", "#test") is None
+        mock_sleep.assert_called_once_with(3)
+        limited.json.assert_not_called()
+
+    @patch("personalized_aws_features.integrations.slack.time.sleep")
+    @patch("personalized_aws_features.integrations.slack.get_http_session")
+    def test_post_blocks_rate_limit_exhausted(self, mock_get_session, mock_sleep):
+        """Test a 429 that outlasts the retries is reported as an HTTP error."""
+        limited = MagicMock(status_code=429, headers={"Retry-After": "1"})
+        mock_get_session.return_value.post.return_value = limited
+
+        assert _post_blocks([], "xoxb-test", "#test") == "http_429"
+        assert mock_sleep.call_count == SLACK_RATE_LIMIT_RETRIES
+
+    @patch("personalized_aws_features.integrations.slack.get_http_session")
+    def test_post_blocks_http_error(self, mock_get_session):
+        """Test a non-200 response fails without parsing the body."""
+        failed = MagicMock(status_code=500, text="Internal Server Error")
+        mock_get_session.return_value.post.return_value = failed
+
+        assert _post_blocks([], "xoxb-test", "#test") == "http_500"
+        failed.json.assert_not_called()
+
+    @patch("personalized_aws_features.integrations.slack.get_http_session")
+    def test_post_blocks_slack_error(self, mock_get_session):
+        """Test an ok: false response returns Slack's error code."""
+        rejected = MagicMock(status_code=200)
+        rejected.json.return_value = {"ok": False, "error": "invalid_blocks"}
+        mock_get_session.return_value.post.return_value = rejected
+
+        assert _post_blocks([], "xoxb-test", "#test") == "invalid_blocks"
+
+    @pytest.mark.parametrize(
+        "summary,expected",
+        [
+            ("*Summary:* Amazon S3 adds X", "Amazon S3 adds X"),
+            ("*Title:* Foo", "Foo"),
+            ("**Summary:** Amazon S3 adds X", "Amazon S3 adds X"),
+            ("Summary: Lambda adds **new** runtimes", "Lambda adds new runtimes"),
+        ],
+    )
+    def test_format_slack_blocks_strips_summary_prefixes(self, summary, expected):
+        """Test summary prefixes and the bold markers around them are removed."""
+        announcement = dict(make_announcements(1)[0], summary=summary)
+
+        blocks = format_slack_blocks(announcement)
+
+        assert blocks[1]["text"]["text"] == f"*Summary:*\n{expected}"